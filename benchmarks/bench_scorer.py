@@ -0,0 +1,231 @@
+"""
+Бенчмарк анализатора читаемости на синтетических корпусах.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_scorer.py --sizes 1K,1M,16M
+    python benchmarks/bench_scorer.py --save-baseline    # сохранить текущие результаты как эталон
+    python benchmarks/bench_scorer.py --sizes 1G --repeat 1
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from src.scorer.analyzer import TextAnalyzer  # noqa: E402
+from src.scorer.document_reader import DocumentReader  # noqa: E402
+from src.scorer.metrics import clear_syllable_cache, count_syllables, extract_metrics  # noqa: E402
+
+CORPORA_DIR = os.path.join(BENCH_DIR, ".corpora")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+# Корпуса крупнее этого порога проверяются только потоковым анализом и анализом через mmap
+MAX_IN_MEMORY = 256 * 1024 * 1024
+# Замеры короче этого порога слишком шумные для поиска регрессий
+MIN_COMPARABLE_SECONDS = 0.005
+
+_UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+_ONSETS = ["", "b", "c", "d", "f", "g", "h", "l", "m", "n", "p", "r", "s", "t", "v", "w", "st", "tr", "pl", "ch"]
+_VOWELS = ["a", "e", "i", "o", "u", "y", "ea", "io", "ou"]
+_CODAS = ["", "", "n", "r", "s", "t", "l", "nd", "ck", "ng"]
+
+
+def parse_size(value: str) -> int:
+    """Разбирает размер вида 64K, 16M, 1G."""
+    value = value.strip().upper()
+    if value[-1] in _UNITS:
+        return int(float(value[:-1]) * _UNITS[value[-1]])
+    return int(value)
+
+
+def format_size(size: int) -> str:
+    for unit in ("G", "M", "K"):
+        if size >= _UNITS[unit] and size % _UNITS[unit] == 0:
+            return f"{size // _UNITS[unit]}{unit}"
+    return str(size)
+
+
+def _make_vocabulary(rng: random.Random, size: int = 5000) -> List[str]:
+    """Псевдоанглийский словарь с распределением слогов от 1 до 5."""
+    vocabulary = []
+    for _ in range(size):
+        syllables = rng.choices([1, 2, 3, 4, 5], weights=[45, 30, 15, 7, 3])[0]
+        vocabulary.append("".join(rng.choice(_ONSETS) + rng.choice(_VOWELS) + rng.choice(_CODAS)
+                                  for _ in range(syllables)))
+    return vocabulary
+
+
+def generate_corpus(size: int, seed: int = 42) -> str:
+    """
+    Создает (или берет готовый) синтетический корпус заданного размера в байтах.
+
+    Частоты слов следуют закону Ципфа, длины предложений - от 5 до 30 слов, текст
+    разбит на абзацы. Генерация идет блоками, поэтому годится и для гигабайтных корпусов.
+
+    :param size: размер в байтах
+    :param seed: зерно генератора (одинаковое зерно - одинаковый корпус)
+    :return: путь к файлу корпуса
+    """
+    os.makedirs(CORPORA_DIR, exist_ok=True)
+    path = os.path.join(CORPORA_DIR, f"synthetic_{format_size(size)}_{seed}.txt")
+    if os.path.exists(path) and os.path.getsize(path) == size:
+        return path
+
+    rng = random.Random(seed)
+    vocabulary = _make_vocabulary(rng)
+    # Накопленные веса считаются один раз: с weights= random.choices пересчитывает их на каждое предложение
+    cum_weights = list(accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+    written = 0
+    with open(path, "w", encoding="ascii", newline="\n") as f:
+        while written < size:
+            words = rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(5, 30))
+            words[0] = words[0].capitalize()
+            sentence = " ".join(words) + rng.choice([".", ".", ".", "?", "!"])
+            sentence += "\n\n" if rng.random() < 0.1 else " "
+            block = sentence[:size - written]
+            f.write(block)
+            written += len(block)
+    return path
+
+
+def _measure(func: Callable[[], object], repeat: int, memory: bool) -> Tuple[float, Optional[int]]:
+    """Лучшее время из repeat запусков и пиковая память (отдельным запуском под tracemalloc)."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(sizes: List[int], repeat: int = 3, memory: bool = True, seed: int = 42) -> Dict[str, Dict]:
+    """
+    Запускает бенчмарки для всех размеров корпусов.
+
+    :return: словарь "бенчмарк@размер" -> {seconds, mb_per_s, tokens_per_s, peak_bytes}
+    """
+    results = {}
+    for size in sizes:
+        path = generate_corpus(size, seed)
+        reader = DocumentReader(path)
+        with open(path, "r", encoding="ascii") as f:
+            tokens = sum(len(line.split()) for line in f)
+
+        cases: List[Tuple[str, Callable[[], object]]] = [
+            ("analyze_stream", lambda: TextAnalyzer(reader).analyze_stream()),
+            ("analyze_mapped", lambda: TextAnalyzer(reader).analyze_mapped())
+        ]
+        if size <= MAX_IN_MEMORY:
+            text = reader.read_text()
+            words = text.split()
+
+            def syllables_cold():
+                clear_syllable_cache()
+                for w in words:
+                    count_syllables(w)
+
+            cases = [
+                ("read_text", reader.read_text),
+                ("extract_metrics", lambda: extract_metrics(text)),
+                ("count_syllables", syllables_cold),
+                ("analyze", lambda: TextAnalyzer(reader).analyze()),
+            ] + cases
+
+        for name, func in cases:
+            seconds, peak = _measure(func, repeat, memory)
+            results[f"{name}@{format_size(size)}"] = {
+                "seconds": seconds,
+                "mb_per_s": size / 1024 ** 2 / seconds if seconds else float("inf"),
+                "tokens_per_s": tokens / seconds if seconds else float("inf"),
+                "peak_bytes": peak
+            }
+    return results
+
+
+def compare_with_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict],
+                          tolerance: float) -> List[str]:
+    """
+    Сравнивает пропускную способность с эталоном.
+
+    :param tolerance: допустимое относительное падение скорости (0.1 = 10%)
+    :return: список описаний регрессий
+    """
+    regressions = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if not reference or reference["seconds"] < MIN_COMPARABLE_SECONDS:
+            continue
+        if current["mb_per_s"] < reference["mb_per_s"] * (1 - tolerance):
+            change = (current["mb_per_s"] / reference["mb_per_s"] - 1) * 100
+            regressions.append(f"{key}: {current['mb_per_s']:.2f} MB/s против "
+                               f"{reference['mb_per_s']:.2f} MB/s в эталоне ({change:+.1f}%)")
+    return regressions
+
+
+def print_results(results: Dict[str, Dict]) -> None:
+    print(f"{'бенчмарк':<28}{'время, с':>12}{'MB/s':>12}{'токенов/с':>16}{'пик, MB':>12}")
+    for key, r in results.items():
+        peak = f"{r['peak_bytes'] / 1024 ** 2:.1f}" if r["peak_bytes"] is not None else "-"
+        print(f"{key:<28}{r['seconds']:>12.4f}{r['mb_per_s']:>12.2f}{r['tokens_per_s']:>16,.0f}{peak:>12}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарк анализатора читаемости.")
+    parser.add_argument("--sizes", default="1K,64K,1M,16M", help="размеры корпусов через запятую (1K..1G)")
+    parser.add_argument("--repeat", type=int, default=3, help="число повторов, берется лучшее время")
+    parser.add_argument("--seed", type=int, default=42, help="зерно генератора корпусов")
+    parser.add_argument("--no-memory", action="store_true", help="не измерять пиковую память")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="файл эталонных результатов")
+    parser.add_argument("--save-baseline", action="store_true", help="сохранить результаты как эталон")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="допустимое падение скорости")
+    parser.add_argument("--output", default=None, help="сохранить результаты в JSON файл")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    results = run_benchmarks(sizes, args.repeat, not args.no_memory, args.seed)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Эталон сохранен в файл: {args.baseline}")
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_with_baseline(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nОбнаружены регрессии производительности:")
+            for line in regressions:
+                print(f"- {line}")
+            return 1
+        print("\nРегрессий относительно эталона нет.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
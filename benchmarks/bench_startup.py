@@ -0,0 +1,87 @@
+"""
+Проверка времени холодного старта неинтерактивного CLI.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --budget-ms 80 --runs 30
+
+Завершается с кодом 1, если запуск CLI медленнее пустого интерпретатора больше чем
+на бюджет или если при старте импортируются тяжелые модули из списка HEAVY_MODULES.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_FILE = os.path.join(ROOT_DIR, "texts", "easy.txt")
+
+# Модули, которые не должны загружаться при обычном вызове CLI
+HEAVY_MODULES = (
+    "numpy", "asyncio", "concurrent.futures", "multiprocessing", "cProfile", "pstats", "csv", "hashlib",
+    "src.scorer.report", "src.scorer.simplifier", "src.scorer.hotspots", "src.scorer.batch",
+    "src.scorer.service", "src.scorer.vectorized", "nltk", "textstat",
+)
+
+_PROBE = """
+import json, sys
+from src.scorer import cli
+import io, contextlib
+with contextlib.redirect_stdout(io.StringIO()):
+    cli.main([sys.argv[1]])
+print(json.dumps(sorted(m for m in json.loads(sys.argv[2]) if m in sys.modules)))
+"""
+
+
+def _median_run_ms(command: List[str], runs: int) -> float:
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR, PYTHONDONTWRITEBYTECODE="")
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=ROOT_DIR, env=env, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def loaded_heavy_modules() -> List[str]:
+    """Какие модули из HEAVY_MODULES загружаются при вызове CLI."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, SAMPLE_FILE, json.dumps(HEAVY_MODULES)],
+        cwd=ROOT_DIR, env=dict(os.environ, PYTHONPATH=ROOT_DIR),
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Проверка времени старта CLI.")
+    parser.add_argument("--runs", type=int, default=20, help="число запусков, берется медиана")
+    parser.add_argument("--budget-ms", type=float, default=60.0,
+                        help="допустимая надбавка ко времени старта пустого интерпретатора, мс")
+    args = parser.parse_args(argv)
+
+    bare = _median_run_ms([sys.executable, "-c", "pass"], args.runs)
+    cli = _median_run_ms([sys.executable, "-m", "src.scorer.cli", SAMPLE_FILE], args.runs)
+    overhead = cli - bare
+    print(f"Пустой интерпретатор: {bare:.1f} мс")
+    print(f"readability-score:    {cli:.1f} мс (надбавка {overhead:.1f} мс, бюджет {args.budget_ms:.0f} мс)")
+
+    failed = False
+    heavy = loaded_heavy_modules()
+    if heavy:
+        print(f"При старте загружаются тяжелые модули: {', '.join(heavy)}")
+        failed = True
+    if overhead > args.budget_ms:
+        print("Бюджет времени старта превышен.")
+        failed = True
+    if not failed:
+        print("Время старта в пределах бюджета.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
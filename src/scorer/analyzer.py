@@ -1,36 +1,204 @@
-from typing import Dict
-from src.scorer.document_reader import DocumentReader
-from src.scorer.metrics import (
-    calculate_flesch_reading_ease,
-    calculate_flesch_kincaid_grade_level,
-    calculate_gunning_fog_index,
-    extract_metrics,
-    count_syllables
+from collections import Counter
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Callable, ContextManager, Dict, List, Optional, Tuple
+from .document_reader import DocumentReader, DEFAULT_CHUNK_SIZE, DEFAULT_WINDOW_SIZE
+from .languages import DETECTION_SAMPLE_SIZE, detect_language
+from .metrics import (
+    calculate_scores,
+    count_bytes_frequencies,
+    count_frequencies,
+    syllable_cache_info,
+    TextCounter
 )
+from .results import ReadabilityResult
+
+if TYPE_CHECKING:
+    # Нужны только для аннотаций; сами объекты создает вызывающий код
+    from .instrumentation import Instrumentation
+    from .result_cache import ResultCache
 
 
 class TextAnalyzer:
-    def __init__(self, reader: DocumentReader):
+    def __init__(self, reader: DocumentReader, cache: Optional["ResultCache"] = None,
+                 instrumentation: Optional["Instrumentation"] = None, language: Optional[str] = None):
         """
         Конструктор класса TextAnalyzer.
 
         :param reader: объект для чтения текста из файла
+        :param cache: кэш результатов; если задан, неизмененные документы не анализируются повторно
+        :param instrumentation: таймеры этапов и счетчики; если не задан, замеры не выполняются
+        :param language: код языка ("en", "ru"); по умолчанию определяется для каждого документа
         """
         self.reader = reader
+        self.cache = cache
+        self.instrumentation = instrumentation
+        self.language = language
+
+    def analyze(self) -> ReadabilityResult:
+        """
+        Выполняет полный анализ текста и возвращает результат.
+
+        :return: результат с метриками и счетчиками (ведет себя как словарь метрик)
+        """
+        return self._run(self._analyze_text, "text")
+
+    def analyze_stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ReadabilityResult:
+        """
+        Выполняет анализ, читая файл по частям; расход памяти не зависит от размера файла.
+
+        :param chunk_size: размер части в символах
+        :return: результат с метриками и счетчиками
+        """
+        return self._run(lambda: self._analyze_chunks(chunk_size), "text")
+
+    def analyze_mapped(self, window_size: int = DEFAULT_WINDOW_SIZE) -> ReadabilityResult:
+        """
+        Выполняет анализ по байтам файла, отображенного в память, без декодирования в str.
+
+        Слова разделяются пробельными символами ASCII; редкие разделители Unicode
+        (например, неразрывный пробел) в этом режиме считаются частью слова.
+
+        :param window_size: размер окна в байтах
+        :return: результат с метриками и счетчиками
+        """
+        return self._run(lambda: self._analyze_mapped(window_size), "bytes")
 
-    def analyze(self) -> Dict[str, float]:
+    def analyze_hotspots(self, window: int = 5, top_n: int = 5,
+                         metric: str = 'flesch_reading_ease') -> Dict[str, List[Dict]]:
         """
-        Выполняет полный анализ текста и возвращает словарь с результатами.
+        Оценивает отдельные предложения и скользящие окна и находит самые сложные фрагменты.
 
-        :return: словарь с метриками
+        :param window: размер окна в предложениях
+        :param top_n: сколько самых сложных фрагментов вернуть
+        :param metric: метрика для выбора сложных фрагментов
+        :return: словарь со списками sentences, windows и hotspots (позиции в символах)
         """
-        text = self.reader.read_text()
-        words, sentences, complex_words = extract_metrics(text)
-        syllable_count = sum(count_syllables(w) for w in text.split())
+        from .hotspots import find_hotspots
+
+        return find_hotspots(self.reader.read_text(), window, top_n, metric, self.language)
+
+    def _analyze_text(self) -> ReadabilityResult:
+        with self._stage("read"):
+            text = self.reader.read_text()
+        language = self.language or detect_language(text)
+        with self._stage("tokenize"):
+            frequencies = Counter(text.split())
+        with self._stage("syllables"):
+            counts = count_frequencies(frequencies, language)
+        return self._score(counts)
+
+    def _analyze_chunks(self, chunk_size: int) -> ReadabilityResult:
+        counter = TextCounter(self.language)
+        chunks = self.reader.iter_chunks(chunk_size)
+        while True:
+            with self._stage("read"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            with self._stage("count"):
+                counter.feed(chunk)
+        return self._score(counter.finish())
+
+    def _analyze_mapped(self, window_size: int) -> ReadabilityResult:
+        totals = [0, 0, 0, 0]
+        language = self.language
+        # Пока язык не определен, окна копятся, пока в них не наберется DETECTION_SAMPLE_SIZE символов
+        pending: List[bytes] = []
+        pending_size = 0
+        next_check = DETECTION_SAMPLE_SIZE
+        windows = self.reader.iter_mapped_windows(window_size)
+        while True:
+            with self._stage("read"):
+                window = next(windows, None)
+            if language is None:
+                if window is not None:
+                    pending.append(window)
+                    pending_size += len(window)
+                    if pending_size < next_check:
+                        continue
+                # Символ UTF-8 занимает от 1 до 4 байт, поэтому декодировать приходится лишь несколько раз
+                sample = b"".join(pending).decode('utf-8', errors='ignore')
+                if window is not None and len(sample) < DETECTION_SAMPLE_SIZE:
+                    next_check = pending_size * 2
+                    continue
+                language = detect_language(sample)
+                # Текущее окно уже среди накопленных
+                for buffered in pending:
+                    self._count_window(buffered, language, totals)
+                pending = []
+            elif window is not None:
+                self._count_window(window, language, totals)
+            if window is None:
+                break
+        return self._score(tuple(totals))
+
+    def _count_window(self, window: bytes, language: str, totals: List[int]) -> None:
+        with self._stage("tokenize"):
+            frequencies = Counter(window.split())
+        with self._stage("syllables"):
+            counts = count_bytes_frequencies(frequencies, language)
+        for k in range(4):
+            totals[k] += counts[k]
+
+    def _score(self, counts: Tuple[int, int, int, int]) -> ReadabilityResult:
+        with self._stage("score"):
+            results = calculate_scores(*counts)
+        if self.instrumentation is not None:
+            self.instrumentation.count("bytes_read", self.reader.size())
+            self.instrumentation.count("tokens", counts[0])
+            self.instrumentation.count("sentences", counts[1])
+        return results
+
+    def _with_cache(self, compute: Callable[[], ReadabilityResult], mode: str) -> ReadabilityResult:
+        """
+        Возвращает результат из кэша по хэшу содержимого или вычисляет и сохраняет его.
+
+        Режимы "text" (analyze, analyze_stream) и "bytes" (analyze_mapped) по-разному
+        разделяют слова, поэтому кэшируются под разными ключами.
+        """
+        if self.cache is None:
+            return compute()
+        if self.reader.single_pass:
+            # Содержимое читается один раз, и хэш известен только после анализа: результат лишь сохраняется
+            self._count("result_cache_misses")
+            results = compute()
+            self.cache.put(self._cache_key(mode), results)
+            return results
+        key = self._cache_key(mode)
+        results = self.cache.get(key)
+        if results is None:
+            self._count("result_cache_misses")
+            results = compute()
+            self.cache.put(key, results)
+        else:
+            self._count("result_cache_hits")
+        return results
+
+    def _cache_key(self, mode: str) -> str:
+        with self._stage("hash"):
+            # Принудительно заданный язык и режим анализа меняют результат, поэтому входят в ключ
+            return self.cache.key_for(f"{self.reader.content_hash()}:{self.language or 'auto'}:{mode}")
+
+    def _run(self, compute: Callable[[], ReadabilityResult], mode: str) -> ReadabilityResult:
+        """Выполняет анализ; при заданном instrumentation собирает статистику и передает ее экспортеру."""
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return self._with_cache(compute, mode)
+        before = syllable_cache_info()
+        with instrumentation.profiled():
+            results = self._with_cache(compute, mode)
+        after = syllable_cache_info()
+        instrumentation.count("documents")
+        instrumentation.count("syllable_cache_hits", after.hits - before.hits)
+        instrumentation.count("syllable_cache_misses", after.misses - before.misses)
+        instrumentation.emit()
+        return results
+
+    def _stage(self, name: str) -> ContextManager:
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.stage(name)
 
-        results = {
-            'flesch_reading_ease': calculate_flesch_reading_ease(words, sentences, syllable_count),
-            'flesch_kincaid_grade_level': calculate_flesch_kincaid_grade_level(words, sentences, syllable_count),
-            'gunning_fog_index': calculate_gunning_fog_index(words, complex_words, sentences)
-        }
-        return results
\ No newline at end of file
+    def _count(self, name: str, value: int = 1) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.count(name, value)
@@ -0,0 +1,392 @@
+import argparse
+import fnmatch
+import glob
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+from functools import partial
+from itertools import chain, groupby
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .analyzer import TextAnalyzer
+from .corpus import CorpusAggregator, format_corpus_report
+from .document_reader import (
+    COMPRESSED_EXTENSIONS,
+    MEMBER_SEPARATOR,
+    DocumentReader,
+    is_archive,
+    iter_archive_documents
+)
+from .instrumentation import Instrumentation
+from .languages import LANGUAGES
+from .pipeline import DEFAULT_IO_WORKERS, DEFAULT_QUEUE_DEPTH, iter_prefetched
+from .report import generate_report
+from .result_cache import ResultCache
+from .results import ReadabilityResult
+from .sinks import ReportSink, open_sink
+
+# Сколько задач сводки приходится на процесс при разбиении по умолчанию
+SUMMARY_TASKS_PER_WORKER = 4
+
+# Кэши результатов рабочего процесса по директориям
+_worker_caches: Dict[str, ResultCache] = {}
+
+
+def collect_paths(target: str, pattern: str = "*.txt") -> List[str]:
+    """
+    Собирает список файлов для анализа.
+
+    В директории подбираются также сжатые варианты шаблона (*.txt.gz, *.txt.bz2,
+    *.txt.xz) и архивы tar/zip. Архив остается одним путем: его файлы
+    анализируются одной задачей за один проход по архиву (см. _analyze_task).
+
+    :param target: директория (обходится рекурсивно) или glob-шаблон
+    :param pattern: шаблон имен файлов внутри директории
+    :return: отсортированный список путей
+    """
+    if os.path.isdir(target):
+        patterns = (pattern,) + tuple(pattern + extension for extension in COMPRESSED_EXTENSIONS)
+        paths = [p for p in glob.glob(os.path.join(target, "**", "*"), recursive=True)
+                 if is_archive(p) or any(fnmatch.fnmatch(os.path.basename(p), name) for name in patterns)]
+    else:
+        paths = glob.glob(target, recursive=True)
+
+    return sorted(p for p in paths if os.path.isfile(p))
+
+
+def _worker_cache(cache_dir: Optional[str]) -> Optional[ResultCache]:
+    """Кэш результатов текущего процесса для директории (None - без кэша)."""
+    if cache_dir is None:
+        return None
+    cache = _worker_caches.get(cache_dir)
+    if cache is None:
+        cache = _worker_caches[cache_dir] = ResultCache(cache_dir)
+    return cache
+
+
+def _analyze_file(file_path: str, cache_dir: Optional[str] = None, collect_stats: bool = False,
+                  language: Optional[str] = None, document: Optional[DocumentReader] = None) -> Dict:
+    """Анализирует один файл в рабочем процессе; ошибки возвращаются как данные."""
+    instrumentation = Instrumentation() if collect_stats else None
+    try:
+        document = document or DocumentReader(file_path)
+        analyzer = TextAnalyzer(document, _worker_cache(cache_dir), instrumentation, language)
+        # Файл tar из потока архива читается один раз и по частям, без копии в памяти
+        results = analyzer.analyze_stream() if document.single_pass else analyzer.analyze()
+        record = {"file": file_path, "metrics": results}
+    except Exception as e:
+        record = {"file": file_path, "error": str(e)}
+    if instrumentation is not None:
+        record["stats"] = instrumentation.snapshot()
+    return record
+
+
+def _analyze_archive(archive_path: str, pattern: str = "*.txt", cache_dir: Optional[str] = None,
+                     collect_stats: bool = False, language: Optional[str] = None) -> Iterator[Dict]:
+    """Анализирует файлы архива за один последовательный проход; ошибка чтения архива - одна запись."""
+    documents = iter_archive_documents(archive_path, pattern)
+    while True:
+        try:
+            document = next(documents, None)
+        except Exception as e:
+            record = {"file": archive_path, "error": str(e)}
+            if collect_stats:
+                record["stats"] = Instrumentation().snapshot()
+            yield record
+            return
+        if document is None:
+            return
+        yield _analyze_file(f"{archive_path}{MEMBER_SEPARATOR}{document.member}", cache_dir, collect_stats,
+                            language, document)
+
+
+def _analyze_task(path: str, pattern: str = "*.txt", cache_dir: Optional[str] = None, collect_stats: bool = False,
+                  language: Optional[str] = None) -> List[Dict]:
+    """Задача рабочего процесса: записи одного файла или всех подходящих файлов архива."""
+    if is_archive(path):
+        return list(_analyze_archive(path, pattern, cache_dir, collect_stats, language))
+    return [_analyze_file(path, cache_dir, collect_stats, language)]
+
+
+def iter_analyze_paths(paths: Iterable[str], workers: Optional[int] = None,
+                       chunksize: int = 16, cache_dir: Optional[str] = None,
+                       instrumentation: Optional[Instrumentation] = None,
+                       language: Optional[str] = None, pattern: str = "*.txt") -> Iterator[Dict]:
+    """
+    Анализирует файлы в пуле процессов и выдает результаты по мере готовности.
+
+    Архив tar/zip - одна задача: процесс читает его за один проход и
+    возвращает записи всех подходящих файлов в виде "архив::имя".
+
+    :param paths: пути к файлам и архивам
+    :param workers: число процессов (по умолчанию - число ядер, 1 - без пула)
+    :param chunksize: сколько файлов передавать процессу за раз
+    :param cache_dir: директория кэша результатов (None - без кэша)
+    :param instrumentation: сюда суммируется статистика этапов из всех процессов
+    :param language: код языка для всех файлов (по умолчанию определяется для каждого)
+    :param pattern: шаблон имен файлов внутри архивов
+    :return: итератор результатов в порядке входных путей
+    """
+    analyze_task = partial(_analyze_task, pattern=pattern, cache_dir=cache_dir,
+                           collect_stats=instrumentation is not None, language=language)
+    if workers == 1:
+        records = chain.from_iterable(map(analyze_task, paths))
+        yield from _merge_stats(records, instrumentation)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        records = chain.from_iterable(executor.map(analyze_task, paths, chunksize=chunksize))
+        yield from _merge_stats(records, instrumentation)
+
+
+def iter_analyze_pipelined(paths: Iterable[str], io_workers: int = DEFAULT_IO_WORKERS,
+                           queue_depth: int = DEFAULT_QUEUE_DEPTH, cache_dir: Optional[str] = None,
+                           instrumentation: Optional[Instrumentation] = None,
+                           language: Optional[str] = None, pattern: str = "*.txt") -> Iterator[Dict]:
+    """
+    Анализирует файлы в текущем процессе, пока пул потоков читает следующие.
+
+    Режим для сетевых и медленных хранилищ: задержка чтения перекрывается
+    расчетом метрик, а опережение чтения ограничено queue_depth документами.
+    В instrumentation попадают этапы prefetch (суммарное время потоков чтения),
+    io_wait (сколько анализ ждал чтения) и этапы анализатора. Архивы читаются
+    последовательно в текущем потоке, за один проход каждый.
+
+    :param paths: пути к файлам и архивам
+    :param io_workers: число потоков чтения
+    :param queue_depth: сколько документов может быть прочитано заранее
+    :param cache_dir: директория кэша результатов (None - без кэша)
+    :param instrumentation: статистика этапов и счетчики
+    :param language: код языка для всех файлов (по умолчанию определяется для каждого)
+    :param pattern: шаблон имен файлов внутри архивов
+    :return: итератор результатов в порядке входных путей
+    """
+    for archives, group in groupby(paths, key=is_archive):
+        if not archives:
+            yield from _iter_prefetched_records(group, io_workers, queue_depth, cache_dir, instrumentation, language)
+            continue
+        for path in group:
+            records = _analyze_archive(path, pattern, cache_dir, instrumentation is not None, language)
+            yield from _merge_stats(records, instrumentation)
+
+
+def _iter_prefetched_records(paths: Iterable[str], io_workers: int, queue_depth: int, cache_dir: Optional[str],
+                             instrumentation: Optional[Instrumentation], language: Optional[str]) -> Iterator[Dict]:
+    cache = _worker_cache(cache_dir)
+    for path, future in iter_prefetched(paths, io_workers, queue_depth, with_hash=cache is not None):
+        try:
+            with instrumentation.stage("io_wait") if instrumentation else nullcontext():
+                document, read_seconds = future.result()
+            if instrumentation is not None:
+                instrumentation.add_time("prefetch", read_seconds)
+            results = TextAnalyzer(document, cache, instrumentation, language).analyze()
+            record = {"file": path, "metrics": results}
+        except Exception as e:
+            record = {"file": path, "error": str(e)}
+        yield record
+
+
+def _merge_stats(records: Iterable[Dict], instrumentation: Optional[Instrumentation]) -> Iterator[Dict]:
+    for record in records:
+        if instrumentation is not None:
+            instrumentation.merge(record.pop("stats"))
+        yield record
+
+
+def _aggregate_records(records: Iterable[Dict], aggregator: CorpusAggregator) -> Iterator[Dict]:
+    """Учитывает записи в сводке по коллекции, передавая их дальше без изменений."""
+    for record in records:
+        if "error" in record:
+            aggregator.add_error()
+        else:
+            aggregator.add(record["metrics"])
+        yield record
+
+
+def _aggregate_files(file_paths: List[str], cache_dir: Optional[str] = None, collect_stats: bool = False,
+                     language: Optional[str] = None,
+                     pattern: str = "*.txt") -> Tuple[CorpusAggregator, Optional[Dict]]:
+    """Сворачивает результаты группы файлов и архивов в сводку внутри рабочего процесса."""
+    aggregator = CorpusAggregator()
+    instrumentation = Instrumentation() if collect_stats else None
+    records = _merge_stats(chain.from_iterable(
+        _analyze_task(path, pattern, cache_dir, collect_stats, language) for path in file_paths), instrumentation)
+    for _ in _aggregate_records(records, aggregator):
+        pass
+    return aggregator, instrumentation.snapshot() if instrumentation is not None else None
+
+
+def aggregate_paths(paths: Iterable[str], workers: Optional[int] = None,
+                    chunksize: Optional[int] = None, cache_dir: Optional[str] = None,
+                    instrumentation: Optional[Instrumentation] = None,
+                    language: Optional[str] = None, pattern: str = "*.txt") -> CorpusAggregator:
+    """
+    Строит сводку по коллекции, не передавая результаты отдельных документов между процессами.
+
+    Каждый процесс сворачивает свою группу файлов в CorpusAggregator, и в
+    основном процессе объединяются только сводки. Сводка с гистограммами
+    весит десятки килобайт, поэтому по умолчанию файлы делятся примерно на
+    SUMMARY_TASKS_PER_WORKER групп на процесс, а не на мелкие задачи.
+
+    :param chunksize: сколько файлов сворачивает процесс за одну задачу (по умолчанию - по числу процессов)
+    :return: сводка по всем файлам (остальные параметры как у iter_analyze_paths)
+    """
+    paths = list(paths)
+    if chunksize is None:
+        tasks = SUMMARY_TASKS_PER_WORKER * (workers or os.cpu_count() or 1)
+        chunksize = max(math.ceil(len(paths) / tasks), 1)
+    groups = [paths[i:i + chunksize] for i in range(0, len(paths), chunksize)]
+    aggregate_files = partial(_aggregate_files, cache_dir=cache_dir, collect_stats=instrumentation is not None,
+                              language=language, pattern=pattern)
+    if workers == 1:
+        return _merge_partials(map(aggregate_files, groups), instrumentation)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _merge_partials(executor.map(aggregate_files, groups), instrumentation)
+
+
+def _merge_partials(partials: Iterable[Tuple[CorpusAggregator, Optional[Dict]]],
+                    instrumentation: Optional[Instrumentation]) -> CorpusAggregator:
+    aggregator = CorpusAggregator()
+    for partial_aggregator, stats in partials:
+        aggregator.merge(partial_aggregator)
+        if instrumentation is not None:
+            instrumentation.merge(stats)
+    return aggregator
+
+
+def analyze_paths(paths: Iterable[str], workers: Optional[int] = None,
+                  chunksize: int = 16, cache_dir: Optional[str] = None,
+                  instrumentation: Optional[Instrumentation] = None,
+                  language: Optional[str] = None, pattern: str = "*.txt") -> List[Dict]:
+    """
+    Анализирует файлы в пуле процессов.
+
+    :return: список результатов в порядке входных путей (параметры как у iter_analyze_paths)
+    """
+    return list(iter_analyze_paths(paths, workers, chunksize, cache_dir, instrumentation, language, pattern))
+
+
+def _write_records(records: Iterable[Dict], sink: ReportSink) -> Tuple[int, int]:
+    """Пишет по одной записи на документ в общий файл; возвращает (всего, с ошибками)."""
+    total = failed = 0
+    for record in records:
+        total += 1
+        if "error" in record:
+            failed += 1
+            sink.write({"source": record["file"], "error": record["error"]})
+        else:
+            generate_report(record["metrics"], "json", sink=sink, source=record["file"])
+    return total, failed
+
+
+def _write_output(records: Iterable[Dict], args: argparse.Namespace,
+                  instrumentation: Optional[Instrumentation]) -> Tuple[int, int, str]:
+    """Пишет записи документов в --output; возвращает (всего, с ошибками, имя файла)."""
+    if args.output and args.output.lower().endswith((".jsonl", ".csv")):
+        # Построчный вывод: записи пишутся по мере готовности, результаты не копятся в памяти
+        filename = args.output
+        with open_sink(filename, flush_size=args.flush_size, append=args.append) as sink:
+            total, failed = _write_records(records, sink)
+        if instrumentation is not None:
+            # Запись в файл идет параллельно с анализом, отдельно ее время не выделяется
+            instrumentation.count("records_written", total)
+    else:
+        results = list(records)
+        total = len(results)
+        failed = sum(1 for r in results if "error" in r)
+        batch_data = {
+            "timestamp": datetime.now().isoformat(),
+            "total_files": total,
+            "failed_files": failed,
+            "results": results
+        }
+        filename = args.output or f"batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json"
+        with instrumentation.stage("report") if instrumentation else nullcontext():
+            with open(filename, 'w', encoding='utf-8') as f:
+                # Метрики остаются компактными объектами до момента записи
+                json.dump(batch_data, f, ensure_ascii=False, default=ReadabilityResult.to_dict)
+    return total, failed, filename
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Пакетный анализ читаемости текстов.")
+    parser.add_argument("target", help="директория или glob-шаблон с файлами")
+    parser.add_argument("--pattern", default="*.txt",
+                        help="шаблон имен файлов в директории и архивах (сжатые .gz/.bz2/.xz подбираются сами)")
+    parser.add_argument("--workers", type=int, default=None, help="число процессов")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="файлов на одну задачу процесса (по умолчанию 16, для --summary - по числу процессов)")
+    parser.add_argument("--output", default=None,
+                        help="итоговый файл: .json - один отчет, .jsonl/.csv - по записи на документ")
+    parser.add_argument("--flush-size", type=int, default=1000, help="записей в буфере перед записью .jsonl/.csv")
+    parser.add_argument("--append", action="store_true", help="дописывать в существующий .jsonl/.csv вместо перезаписи")
+    parser.add_argument("--cache-dir", default=None, help="директория кэша результатов по хэшу содержимого")
+    parser.add_argument("--stats", action="store_true", help="вывести время этапов и счетчики")
+    parser.add_argument("--language", choices=sorted(LANGUAGES), default=None,
+                        help="язык текстов (по умолчанию определяется для каждого файла)")
+    parser.add_argument("--prefetch", type=int, default=None, metavar="THREADS",
+                        help="анализ в одном процессе с чтением файлов заранее в THREADS потоках "
+                             "(для сетевых и медленных дисков)")
+    parser.add_argument("--queue-depth", type=int, default=DEFAULT_QUEUE_DEPTH,
+                        help="сколько файлов читать заранее в режиме --prefetch")
+    parser.add_argument("--summary", default=None,
+                        help="файл сводки по коллекции (.json); без --output пишется только сводка")
+    args = parser.parse_args(argv)
+
+    paths = collect_paths(args.target, args.pattern)
+    if not paths:
+        print(f"Файлы для анализа не найдены: {args.target}")
+        return 1
+
+    instrumentation = Instrumentation() if args.stats else None
+    started = time.perf_counter()
+    aggregator = None
+    if args.summary and not args.output and args.prefetch is None:
+        # Только сводка: процессы возвращают свернутые результаты, записи документов не передаются
+        aggregator = aggregate_paths(paths, args.workers, args.chunksize, args.cache_dir, instrumentation,
+                                     args.language, args.pattern)
+        total, failed = aggregator.documents + aggregator.failed, aggregator.failed
+        filename = args.summary
+    else:
+        if args.prefetch is not None:
+            records = iter_analyze_pipelined(paths, args.prefetch, args.queue_depth, args.cache_dir,
+                                             instrumentation, args.language, args.pattern)
+        else:
+            records = iter_analyze_paths(paths, args.workers, args.chunksize or 16, args.cache_dir, instrumentation,
+                                         args.language, args.pattern)
+        if args.summary:
+            aggregator = CorpusAggregator()
+            records = _aggregate_records(records, aggregator)
+        total, failed, filename = _write_output(records, args, instrumentation)
+
+    if aggregator is not None:
+        summary = aggregator.report()
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump({"timestamp": datetime.now().isoformat(), **summary}, f, ensure_ascii=False, indent=2)
+        print(format_corpus_report(summary) + "\n")
+
+    print(f"Проанализировано файлов: {total}, с ошибками: {failed}")
+    print(f"✓ Результаты сохранены в файл: {filename}")
+    if args.summary and args.output:
+        print(f"✓ Сводка по коллекции сохранена в файл: {args.summary}")
+    if instrumentation is not None:
+        bytes_read = instrumentation.counters.get("bytes_read", 0)
+        print(f"\nОбщее время: {time.perf_counter() - started:.4f} с")
+        print("Время этапов (суммарно по процессам и потокам), с:")
+        for name, seconds in instrumentation.timings.items():
+            # Для этапов ожидания пропускная способность не имеет смысла
+            if bytes_read and seconds and not name.endswith("_wait"):
+                print(f"  {name}: {seconds:.4f} ({bytes_read / seconds / 1e6:.1f} МБ/с)")
+            else:
+                print(f"  {name}: {seconds:.4f}")
+        print("Счетчики:")
+        for name, value in instrumentation.counters.items():
+            print(f"  {name}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from .analyzer import TextAnalyzer
+from .document_reader import DocumentReader
+from .metrics import select_metrics
+
+# Модули отчетов, рекомендаций, пулов процессов и NumPy сюда не импортируются:
+# команда запускается короткоживущим подпроцессом, и время старта важнее всего.
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Неинтерактивный анализ файлов: по одной JSON-строке с результатом на файл в stdout.
+
+    :param argv: аргументы командной строки (по умолчанию sys.argv[1:])
+    :return: код завершения (1, если хотя бы один файл не удалось проанализировать)
+    """
+    parser = argparse.ArgumentParser(prog="readability-score", description="Оценка читаемости текстовых файлов.")
+    parser.add_argument("files", nargs="+", help="пути к файлам .txt")
+    parser.add_argument("--mode", choices=("full", "stream", "mapped"), default="full",
+                        help="чтение файла целиком, по частям или через отображение в память")
+    parser.add_argument("--language", default=None, help="код языка (по умолчанию определяется автоматически)")
+    parser.add_argument("--metric", choices=("flesch", "kincaid", "gunning", "average", "all"), default="all",
+                        help="какие метрики выводить")
+    parser.add_argument("--recommendations", action="store_true", help="добавить рекомендации")
+    args = parser.parse_args(argv)
+
+    exit_code = 0
+    for file_path in args.files:
+        analyzer = TextAnalyzer(DocumentReader(file_path), language=args.language)
+        try:
+            if args.mode == "stream":
+                results = analyzer.analyze_stream()
+            elif args.mode == "mapped":
+                results = analyzer.analyze_mapped()
+            else:
+                results = analyzer.analyze()
+        except (OSError, ValueError, ZeroDivisionError) as e:
+            print(json.dumps({"file": file_path, "error": str(e)}, ensure_ascii=False))
+            exit_code = 1
+            continue
+
+        record = {"file": file_path, "metrics": select_metrics(results, args.metric)}
+        if args.recommendations:
+            from .simplifier import collect_improvements
+
+            record["improvements"] = [r._asdict() for r in collect_improvements(results)]
+        print(json.dumps(record, ensure_ascii=False))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
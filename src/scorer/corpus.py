@@ -0,0 +1,226 @@
+import math
+import operator
+from array import array
+from typing import Callable, Dict, Tuple
+
+from .metrics import calculate_average_readability, calculate_scores
+from .report import _interpret_flesch, _interpret_gunning_fog
+from .results import COUNT_NAMES, METRIC_NAMES, ReadabilityResult
+
+# Диапазоны гистограмм для процентилей; значения за пределами попадают в крайние корзины
+HISTOGRAM_RANGES: Dict[str, Tuple[float, float]] = {
+    'flesch_reading_ease': (-100.0, 130.0),
+    'flesch_kincaid_grade_level': (-5.0, 40.0),
+    'gunning_fog_index': (0.0, 50.0),
+    'average_readability': (-150.0, 130.0),
+}
+DEFAULT_BIN_WIDTH = 0.1
+PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+# Метрики, для которых считается распределение документов по уровням сложности
+_BANDS: Dict[str, Callable[[float], str]] = {
+    'flesch_reading_ease': _interpret_flesch,
+    'gunning_fog_index': _interpret_gunning_fog,
+}
+
+
+class MetricSummary:
+    def __init__(self, low: float, high: float, bin_width: float = DEFAULT_BIN_WIDTH):
+        """
+        Конструктор класса MetricSummary - сводки по одной метрике без хранения значений.
+
+        Хранит число значений, суммы для среднего и отклонения, минимум, максимум
+        и гистограмму с корзинами фиксированной ширины. Сводки с одинаковыми
+        параметрами складываются через merge, а процентили оцениваются по
+        гистограмме с погрешностью не больше ширины корзины.
+
+        :param low: нижняя граница гистограммы
+        :param high: верхняя граница гистограммы
+        :param bin_width: ширина корзины
+        """
+        self.low = low
+        self.high = high
+        self.bin_width = bin_width
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        # Корзина 0 - значения ниже low, последняя - значения не ниже high
+        self.bins = array('q', bytes(8 * (math.ceil((high - low) / bin_width) + 2)))
+
+    def add(self, value: float) -> None:
+        """
+        Учитывает значение (NaN пропускаются).
+
+        :param value: значение метрики
+        """
+        if math.isnan(value):
+            return
+        self.count += 1
+        self.total += value
+        self.total_squares += value * value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value < self.low:
+            index = 0
+        else:
+            index = min(int((value - self.low) / self.bin_width) + 1, len(self.bins) - 1)
+        self.bins[index] += 1
+
+    def merge(self, other: "MetricSummary") -> None:
+        """
+        Добавляет сводку с теми же границами и шириной корзин.
+
+        :param other: сводка, например полученная из другого процесса
+        """
+        if (other.low, other.high, other.bin_width) != (self.low, self.high, self.bin_width):
+            raise ValueError("Нельзя объединить сводки с разными гистограммами")
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.bins = array('q', map(operator.add, self.bins, other.bins))
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        if not self.count:
+            return math.nan
+        return math.sqrt(max(self.total_squares / self.count - self.mean ** 2, 0.0))
+
+    def percentile(self, percent: float) -> float:
+        """
+        Оценка процентиля по гистограмме (линейная интерполяция внутри корзины).
+
+        :param percent: процент от 0 до 100
+        :return: значение процентиля (NaN, если значений нет)
+        """
+        if not self.count:
+            return math.nan
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, in_bin in enumerate(self.bins):
+            if in_bin and seen + in_bin >= rank:
+                if index == 0:
+                    return self.min
+                if index == len(self.bins) - 1:
+                    return self.max
+                start = self.low + (index - 1) * self.bin_width
+                value = start + (rank - seen) / in_bin * self.bin_width
+                return min(max(value, self.min), self.max)
+            seen += in_bin
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Сводка для отчета.
+
+        :return: словарь count, mean, std, min, max и процентилей p10...p99 (только count, если значений нет)
+        """
+        if not self.count:
+            return {"count": 0}
+        summary = {"count": self.count, "mean": self.mean, "std": self.std, "min": self.min, "max": self.max}
+        summary.update((f"p{p}", self.percentile(p)) for p in PERCENTILES)
+        return summary
+
+
+class CorpusAggregator:
+    def __init__(self, bin_width: float = DEFAULT_BIN_WIDTH):
+        """
+        Конструктор класса CorpusAggregator - потоковой сводки по коллекции документов.
+
+        Результаты добавляются по мере готовности и сразу сворачиваются в суммы
+        счетчиков, сводки MetricSummary и распределения по уровням сложности,
+        поэтому память не зависит от числа документов. Агрегаторы отдельных
+        процессов объединяются через merge.
+
+        :param bin_width: ширина корзины гистограмм процентилей
+        """
+        self.documents = 0
+        self.failed = 0
+        self.totals = dict.fromkeys(COUNT_NAMES, 0)
+        self.metrics = {name: MetricSummary(low, high, bin_width) for name, (low, high) in HISTOGRAM_RANGES.items()}
+        self.bands: Dict[str, Dict[str, int]] = {name: {} for name in _BANDS}
+
+    def add(self, results: ReadabilityResult) -> None:
+        """
+        Учитывает результат анализа одного документа.
+
+        :param results: результат TextAnalyzer
+        """
+        self.documents += 1
+        for name in COUNT_NAMES:
+            self.totals[name] += getattr(results, name)
+        for name in METRIC_NAMES:
+            self.metrics[name].add(results[name])
+        self.metrics['average_readability'].add(calculate_average_readability(
+            results['flesch_reading_ease'], results['flesch_kincaid_grade_level'], results['gunning_fog_index']))
+        for name, interpret in _BANDS.items():
+            band = interpret(results[name])
+            self.bands[name][band] = self.bands[name].get(band, 0) + 1
+
+    def add_error(self) -> None:
+        """Учитывает документ, который не удалось проанализировать."""
+        self.failed += 1
+
+    def merge(self, other: "CorpusAggregator") -> None:
+        """
+        Добавляет сводку другого агрегатора.
+
+        :param other: агрегатор, например вернувшийся из рабочего процесса
+        """
+        self.documents += other.documents
+        self.failed += other.failed
+        for name, value in other.totals.items():
+            self.totals[name] += value
+        for name, summary in other.metrics.items():
+            self.metrics[name].merge(summary)
+        for name, bands in other.bands.items():
+            for band, value in bands.items():
+                self.bands[name][band] = self.bands[name].get(band, 0) + value
+
+    def report(self) -> Dict:
+        """
+        Отчет по коллекции.
+
+        corpus - индексы по суммарным счетчикам, как если бы все документы были
+        одним текстом; metrics - распределения индексов по документам.
+
+        :return: словарь с отчетом
+        """
+        totals = self.totals
+        corpus = None
+        if totals['words'] and totals['sentences']:
+            corpus = calculate_scores(*(totals[name] for name in COUNT_NAMES)).to_dict(include_counts=True)
+        return {
+            "documents": self.documents,
+            "failed_documents": self.failed,
+            "corpus": corpus,
+            "metrics": {name: summary.summary() for name, summary in self.metrics.items()},
+            "bands": {name: dict(sorted(bands.items(), key=lambda item: -item[1]))
+                      for name, bands in self.bands.items()}
+        }
+
+
+def format_corpus_report(report: Dict) -> str:
+    """
+    Текстовое представление отчета CorpusAggregator.report().
+
+    :param report: отчет по коллекции
+    :return: текст для вывода в консоль
+    """
+    lines = [f"Документов: {report['documents']}, с ошибками: {report['failed_documents']}"]
+    for name, summary in report["metrics"].items():
+        if not summary["count"]:
+            continue
+        lines.append(f"{name}: среднее {summary['mean']:.2f}, медиана {summary['p50']:.2f}, "
+                     f"p10-p90 {summary['p10']:.2f}..{summary['p90']:.2f}")
+    for name, bands in report["bands"].items():
+        lines.append(f"{name} по уровням:")
+        lines.extend(f"  {band}: {count}" for band, count in bands.items())
+    return "\n".join(lines)
@@ -1,19 +1,326 @@
-from typing import List
+import fnmatch
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_WINDOW_SIZE = 1024 * 1024
+ASCII_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+_WHITESPACE_BYTES = tuple(bytes([b]) for b in ASCII_WHITESPACE)
+
+# Сжатые файлы распаковываются на лету; модули сжатия импортируются только при необходимости
+COMPRESSED_EXTENSIONS = ('.gz', '.bz2', '.xz')
+ARCHIVE_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz', '.zip')
+# Разделитель пути к архиву и имени файла внутри него: "texts.tar.gz::docs/a.txt"
+MEMBER_SEPARATOR = "::"
+
+
+def is_archive(path: str) -> bool:
+    """Является ли файл архивом tar или zip (по расширению)."""
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def iter_archive_members(archive_path: str) -> Iterator[str]:
+    """
+    Перечисляет файлы внутри архива tar или zip, не распаковывая их.
+
+    :param archive_path: путь к архиву
+    :return: итератор имен файлов в порядке хранения в архиве
+    """
+    if archive_path.lower().endswith('.zip'):
+        import zipfile
+
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    yield info.filename
+    else:
+        import tarfile
+
+        with tarfile.open(archive_path, 'r:*') as archive:
+            for member in archive:
+                if member.isfile():
+                    yield member.name
+
+
+def iter_archive_documents(archive_path: str, pattern: str = "*") -> Iterator["DocumentReader"]:
+    """
+    Выдает документы архива tar или zip за один последовательный проход.
+
+    Сжатый tar читается потоком ('r|*') и распаковывается один раз, а не с начала
+    для каждого файла, как при открытии пути "архив::имя". Файл tar выдается как
+    ArchiveMemberStream поверх потока архива: его нужно прочитать до перехода к
+    следующему документу, и только один раз. Файлы zip читаются по запросу.
+
+    :param archive_path: путь к архиву
+    :param pattern: шаблон имен файлов внутри архива
+    :return: итератор документов в порядке хранения в архиве
+    """
+    if archive_path.lower().endswith('.zip'):
+        for member in iter_archive_members(archive_path):
+            if fnmatch.fnmatch(os.path.basename(member), pattern):
+                yield DocumentReader(archive_path, member)
+        return
+    import tarfile
+
+    with tarfile.open(archive_path, 'r|*') as archive:
+        for member in archive:
+            if member.isfile() and fnmatch.fnmatch(os.path.basename(member.name), pattern):
+                with archive.extractfile(member) as stream:
+                    yield ArchiveMemberStream(archive_path, member.name, stream, member.size)
+
+
+def _open_compressed(file_path: str) -> BinaryIO:
+    """Открывает файл на чтение байтов с распаковкой по расширению .gz, .bz2 или .xz."""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.gz':
+        import gzip
+
+        return gzip.open(file_path, 'rb')
+    if extension == '.bz2':
+        import bz2
+
+        return bz2.open(file_path, 'rb')
+    if extension == '.xz':
+        import lzma
+
+        return lzma.open(file_path, 'rb')
+    return open(file_path, 'rb')
+
 
 class DocumentReader:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, member: Optional[str] = None):
         """
         Конструктор класса DocumentReader.
-        
-        :param file_path: путь к файлу .txt
+
+        Файлы .gz, .bz2 и .xz и файлы внутри архивов tar/zip читаются потоком,
+        без распаковки на диск. Файл в архиве задается параметром member или
+        путем вида "архив::имя".
+
+        :param file_path: путь к файлу .txt (возможно, сжатому) или к архиву
+        :param member: имя файла внутри архива
         """
+        if member is None and MEMBER_SEPARATOR in file_path:
+            file_path, member = file_path.split(MEMBER_SEPARATOR, 1)
         self.file_path = file_path
-    
+        self.member = member
+
+    # Содержимое можно прочитать только один раз (см. ArchiveMemberStream)
+    single_pass = False
+
+    @contextmanager
+    def open_binary(self) -> Iterator[BinaryIO]:
+        """
+        Открывает содержимое документа как поток байтов, распаковывая его на лету.
+
+        :return: контекстный менеджер с потоком байтов
+        """
+        if self.member is None:
+            with _open_compressed(self.file_path) as stream:
+                yield stream
+            return
+        if self.file_path.lower().endswith('.zip'):
+            import zipfile
+
+            archive = zipfile.ZipFile(self.file_path)
+            extract = archive.open
+        else:
+            import tarfile
+
+            archive = tarfile.open(self.file_path, 'r:*')
+            extract = archive.extractfile
+        with archive:
+            try:
+                stream = extract(self.member)
+            except KeyError:
+                raise FileNotFoundError(f"В архиве {self.file_path} нет файла {self.member}") from None
+            if stream is None:
+                raise ValueError(f"{self.member} в архиве {self.file_path} не является файлом")
+            with stream:
+                yield stream
+
+    @property
+    def is_plain(self) -> bool:
+        """Обычный несжатый файл (его можно отобразить в память)."""
+        return self.member is None and not self.file_path.lower().endswith(COMPRESSED_EXTENSIONS)
+
     def read_text(self) -> str:
         """
         Читает содержимое файла и возвращает текст.
         
         :return: строка с текстом документа
         """
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            return f.read()
\ No newline at end of file
+        with self.open_binary() as stream, io.TextIOWrapper(stream, encoding='utf-8') as f:
+            return f.read()
+
+    def size(self) -> int:
+        """
+        Размер документа в байтах: для файла на диске и файла в zip - сжатый размер,
+        для файла в tar - распакованный (tar сжимается целиком, а не по файлам).
+
+        :return: размер файла
+        """
+        if self.member is None:
+            return os.path.getsize(self.file_path)
+        if self.file_path.lower().endswith('.zip'):
+            import zipfile
+
+            with zipfile.ZipFile(self.file_path) as archive:
+                return archive.getinfo(self.member).compress_size
+        import tarfile
+
+        with tarfile.open(self.file_path, 'r:*') as archive:
+            return archive.getmember(self.member).size
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Читает файл по частям, не загружая его в память целиком.
+
+        Границы частей могут проходить посреди слова, склейку выполняет TextCounter.
+
+        :param chunk_size: размер части в символах
+        :return: итератор по частям текста
+        """
+        with self.open_binary() as stream, io.TextIOWrapper(stream, encoding='utf-8') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def content_hash(self, block_size: int = DEFAULT_CHUNK_SIZE) -> str:
+        """
+        Вычисляет хэш содержимого файла, читая его блоками.
+
+        Для сжатых файлов хэшируется распакованное содержимое, поэтому ключ кэша
+        не зависит от способа хранения документа.
+
+        :param block_size: размер блока в байтах
+        :return: шестнадцатеричный SHA-256
+        """
+        import hashlib
+
+        digest = hashlib.sha256()
+        with self.open_binary() as f:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    break
+                digest.update(block)
+        return digest.hexdigest()
+
+    def iter_mapped_windows(self, window_size: int = DEFAULT_WINDOW_SIZE) -> Iterator[bytes]:
+        """
+        Отображает файл в память и выдает его байты окнами, выровненными по пробелам.
+
+        Файл не декодируется и не копируется в память целиком: одновременно в куче
+        находится только одно окно, остальное остается в страничном кэше ОС.
+        Окно продлевается до ближайшего пробельного символа, поэтому слова не разрываются.
+        Сжатые файлы и файлы в архивах отобразить в память нельзя: они распаковываются
+        потоком и выдаются такими же окнами.
+
+        :param window_size: размер окна в байтах
+        :return: итератор по окнам байтов
+        """
+        if not self.is_plain:
+            yield from self._iter_stream_windows(window_size)
+            return
+        with open(self.file_path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Пустой файл нельзя отобразить в память
+                return
+            with mapped:
+                size = len(mapped)
+                start = 0
+                while start < size:
+                    end = min(start + window_size, size)
+                    while end < size and mapped[end] not in ASCII_WHITESPACE:
+                        end += 1
+                    yield mapped[start:end]
+                    start = end
+
+    def _iter_stream_windows(self, window_size: int) -> Iterator[bytes]:
+        """Окна байтов распакованного потока; хвост после последнего пробела переносится в следующее окно."""
+        with self.open_binary() as stream:
+            tail = b""
+            while True:
+                block = stream.read(window_size)
+                if not block:
+                    if tail:
+                        yield tail
+                    return
+                window = tail + block
+                cut = max(window.rfind(whitespace) for whitespace in _WHITESPACE_BYTES)
+                if cut < 0:
+                    tail = window
+                    continue
+                tail = window[cut:]
+                yield window[:cut]
+
+
+class _HashingStream(io.RawIOBase):
+    """Поток байтов, по пути считающий SHA-256 прочитанного."""
+
+    def __init__(self, stream: BinaryIO, digest):
+        self._stream = stream
+        self._digest = digest
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        self._digest.update(data)
+        return len(data)
+
+
+class ArchiveMemberStream(DocumentReader):
+    single_pass = True
+
+    def __init__(self, file_path: str, member: str, stream: BinaryIO, size: int):
+        """
+        Конструктор класса ArchiveMemberStream - файла tar, читаемого прямо из потока архива.
+
+        Содержимое не копируется в память целиком: его можно прочитать один раз,
+        например через iter_chunks, а хэш содержимого считается в том же проходе
+        и доступен после чтения.
+
+        :param file_path: путь к архиву
+        :param member: имя файла внутри архива
+        :param stream: открытый поток файла в архиве
+        :param size: распакованный размер файла
+        """
+        import hashlib
+
+        super().__init__(file_path, member)
+        self._stream = stream
+        self._digest = hashlib.sha256()
+        self._size = size
+        self._consumed = False
+
+    @contextmanager
+    def open_binary(self) -> Iterator[BinaryIO]:
+        if self._consumed:
+            raise ValueError(f"{self.member} в архиве {self.file_path} уже прочитан")
+        self._consumed = True
+        yield io.BufferedReader(_HashingStream(self._stream, self._digest), DEFAULT_CHUNK_SIZE)
+
+    def content_hash(self, block_size: int = DEFAULT_CHUNK_SIZE) -> str:
+        """
+        Хэш содержимого, посчитанный при чтении (если файл еще не читался, он дочитывается).
+
+        :param block_size: размер блока в байтах
+        :return: шестнадцатеричный SHA-256
+        """
+        if not self._consumed:
+            return super().content_hash(block_size)
+        return self._digest.hexdigest()
+
+    def size(self) -> int:
+        return self._size
@@ -0,0 +1,127 @@
+import re
+from itertools import accumulate
+from typing import Dict, List, Mapping, Optional
+
+from .languages import detect_language, get_language
+from .metrics import SENTENCE_END_RE, calculate_scores, count_syllables
+
+TOKEN_RE = re.compile(r'\S+')
+
+# Для каких метрик большее значение означает более сложный текст
+_HARDER_IS_HIGHER = {
+    'flesch_reading_ease': False,
+    'flesch_kincaid_grade_level': True,
+    'gunning_fog_index': True
+}
+
+
+def split_sentences(text: str, language: Optional[str] = None) -> Dict[str, List[int]]:
+    """
+    Разбивает текст на предложения за один проход и считает слова, слоги и сложные слова в каждом.
+
+    Предложение заканчивается на слове, содержащем знак конца предложения;
+    хвост текста без такого знака образует последнее предложение.
+
+    :param text: исходный текст
+    :param language: код языка (по умолчанию определяется по тексту)
+    :return: словарь списков одинаковой длины: start, end, words, sentences, syllables, complex_words
+    """
+    if language is None:
+        language = detect_language(text)
+    complex_syllables = get_language(language).complex_syllables
+    columns: Dict[str, List[int]] = {
+        'start': [], 'end': [], 'words': [], 'sentences': [], 'syllables': [], 'complex_words': []
+    }
+    start = None
+    words = syllables = complex_words = 0
+    end = 0
+    for match in TOKEN_RE.finditer(text):
+        word = match.group()
+        if start is None:
+            start = match.start()
+        end = match.end()
+        words += 1
+        word_syllables = count_syllables(word, language)
+        syllables += word_syllables
+        if word_syllables >= complex_syllables:
+            complex_words += 1
+        terminators = len(SENTENCE_END_RE.findall(word))
+        if terminators:
+            _append_sentence(columns, start, end, words, terminators, syllables, complex_words)
+            start = None
+            words = syllables = complex_words = 0
+    if start is not None:
+        _append_sentence(columns, start, end, words, 0, syllables, complex_words)
+    return columns
+
+
+def _append_sentence(columns: Dict[str, List[int]], start: int, end: int, words: int,
+                     sentences: int, syllables: int, complex_words: int) -> None:
+    columns['start'].append(start)
+    columns['end'].append(end)
+    columns['words'].append(words)
+    columns['sentences'].append(sentences)
+    columns['syllables'].append(syllables)
+    columns['complex_words'].append(complex_words)
+
+
+def _span_scores(words: int, sentences: int, syllables: int, complex_words: int) -> Mapping[str, float]:
+    # Фрагмент без знака конца предложения считается одним предложением
+    return calculate_scores(words, max(sentences, 1), syllables, complex_words)
+
+
+def find_hotspots(text: str, window: int = 5, top_n: int = 5,
+                  metric: str = 'flesch_reading_ease', language: Optional[str] = None) -> Dict[str, List[Dict]]:
+    """
+    Оценивает каждое предложение и скользящие окна из window предложений.
+
+    Счетчики окон берутся как разности префиксных сумм по предложениям, поэтому
+    время работы линейно по длине текста при любом размере окна.
+
+    :param text: исходный текст
+    :param window: размер окна в предложениях
+    :param top_n: сколько самых сложных фрагментов вернуть
+    :param metric: метрика для выбора сложных фрагментов
+    :param language: код языка (по умолчанию определяется по тексту)
+    :return: словарь со списками sentences, windows и hotspots
+    """
+    if metric not in _HARDER_IS_HIGHER:
+        raise ValueError(f"Неизвестная метрика: {metric}")
+    if window < 1:
+        raise ValueError("Размер окна должен быть положительным")
+
+    columns = split_sentences(text, language)
+    count = len(columns['start'])
+    keys = ('words', 'sentences', 'syllables', 'complex_words')
+    prefix = {key: [0] + list(accumulate(columns[key])) for key in keys}
+
+    sentences = [
+        {
+            'start': columns['start'][i],
+            'end': columns['end'][i],
+            **_span_scores(*(columns[key][i] for key in keys))
+        }
+        for i in range(count)
+    ]
+
+    window = min(window, count)
+    windows = []
+    for i in range(count - window + 1 if count else 0):
+        span_counts = (prefix[key][i + window] - prefix[key][i] for key in keys)
+        windows.append({
+            'start': columns['start'][i],
+            'end': columns['end'][i + window - 1],
+            'first_sentence': i,
+            **_span_scores(*span_counts)
+        })
+
+    # Самые сложные окна, не пересекающиеся друг с другом
+    reverse = _HARDER_IS_HIGHER[metric]
+    hotspots: List[Dict] = []
+    for candidate in sorted(windows, key=lambda w: w[metric], reverse=reverse):
+        if len(hotspots) >= top_n:
+            break
+        if all(candidate['end'] <= h['start'] or candidate['start'] >= h['end'] for h in hotspots):
+            hotspots.append(candidate)
+
+    return {'sentences': sentences, 'windows': windows, 'hotspots': hotspots}
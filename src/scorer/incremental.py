@@ -0,0 +1,197 @@
+import re
+from itertools import chain
+from typing import List, Mapping, Optional, Tuple
+
+from .languages import DETECTION_SAMPLE_SIZE, detect_language
+from .metrics import calculate_scores, count_text
+
+# Граница единицы - пробельный символ после знака конца предложения или перевод строки
+UNIT_END_RE = re.compile(r'[.?!]\s|\n')
+WHITESPACE_RE = re.compile(r'\s')
+# Длинные фрагменты без границ предложений режутся по пробелу после MAX_UNIT_LENGTH символов
+MAX_UNIT_LENGTH = 1024
+# Единицы хранятся блоками, чтобы сдвиг позиций после правки не затрагивал весь текст
+BLOCK_SIZE = 64
+
+Counts = Tuple[int, int, int, int]
+
+
+def split_units(text: str) -> List[str]:
+    """
+    Делит текст на единицы пересчета: предложения, а длинные фрагменты - на части.
+
+    Каждая единица, кроме последней, заканчивается пробельным символом, поэтому
+    ни слово, ни серия знаков конца предложения не пересекают границу единиц,
+    и счетчики count_text текста равны сумме счетчиков единиц.
+
+    :param text: текст
+    :return: непустые единицы, склейка которых дает text ([""] для пустого текста)
+    """
+    units: List[str] = []
+    start = 0
+    ends = chain((match.end() for match in UNIT_END_RE.finditer(text)), [len(text)])
+    for end in ends:
+        while end - start > MAX_UNIT_LENGTH:
+            match = WHITESPACE_RE.search(text, start + MAX_UNIT_LENGTH, end - 1)
+            if match is None:
+                break
+            units.append(text[start:match.end()])
+            start = match.end()
+        if end > start:
+            units.append(text[start:end])
+            start = end
+    return units or [""]
+
+
+class IncrementalAnalyzer:
+    def __init__(self, text: str = "", language: Optional[str] = None):
+        """
+        Конструктор класса IncrementalAnalyzer - анализатора редактируемого текста.
+
+        Текст хранится по предложениям (см. split_units) вместе со счетчиками
+        count_text для каждого из них, а предложения сгруппированы в блоки по
+        BLOCK_SIZE с известной длиной каждого блока. Правка пересчитывает только
+        затронутые предложения и длины их блоков: позиции остальных предложений
+        нигде не хранятся и не переписываются, поэтому стоимость правки зависит
+        от ее размера, а не от длины текста.
+
+        Если язык не задан, он определяется, как в count_text, по первым
+        DETECTION_SAMPLE_SIZE символам и уточняется после каждой правки в этой
+        части текста; при смене языка все предложения пересчитываются.
+
+        :param text: исходный текст
+        :param language: код языка (по умолчанию определяется по тексту)
+        """
+        self._detect_language = language is None
+        self.language = language or detect_language(text)
+        units = split_units(text)
+        counts = [count_text(unit, self.language) for unit in units]
+        self._blocks: List[List[str]] = [units[i:i + BLOCK_SIZE] for i in range(0, len(units), BLOCK_SIZE)]
+        self._block_counts: List[List[Counts]] = [counts[i:i + BLOCK_SIZE] for i in range(0, len(counts), BLOCK_SIZE)]
+        self._block_lengths: List[int] = [sum(map(len, block)) for block in self._blocks]
+        self._length = len(text)
+        self._totals = [sum(c[k] for c in counts) for k in range(4)]
+
+    @property
+    def text(self) -> str:
+        """Текущий текст целиком (собирается заново при каждом обращении)."""
+        return "".join(chain.from_iterable(self._blocks))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def counts(self) -> Tuple[int, int, int, int]:
+        """
+        Текущие счетчики текста.
+
+        :return: tuple of (words, sentences, syllables, complex_words)
+        """
+        words, sentences, syllables, complex_words = self._totals
+        return words, sentences, syllables, complex_words
+
+    def scores(self) -> Mapping[str, float]:
+        """
+        Индексы читаемости текущего текста.
+
+        :return: результат с метриками (пустой словарь, пока в тексте нет слов или предложений)
+        """
+        words, sentences, syllables, complex_words = self._totals
+        if words == 0 or sentences == 0:
+            return {}
+        return calculate_scores(words, sentences, syllables, complex_words)
+
+    def apply_edit(self, offset: int, removed: int, inserted: str = "") -> Mapping[str, float]:
+        """
+        Применяет правку и возвращает обновленные индексы.
+
+        Пересчитываются предложения, которых касается правка, и следующее за ней
+        предложение (удаление пробела в конце предложения склеивает его со
+        следующим); итоги меняются на разницу их счетчиков.
+
+        :param offset: позиция начала правки в символах
+        :param removed: число удаленных символов
+        :param inserted: вставленный текст
+        :return: словарь с метриками
+        """
+        end = offset + removed
+        if offset < 0 or removed < 0 or end > len(self):
+            raise ValueError(f"Правка ({offset}, {removed}) выходит за пределы текста длиной {len(self)}")
+
+        first_block, first_unit, segment_start = self._locate(offset)
+        last_block, last_unit, _ = self._locate(end)
+        old_units: List[str] = []
+        old_counts: List[Counts] = []
+        for index in range(first_block, last_block + 1):
+            low = first_unit if index == first_block else 0
+            high = last_unit + 1 if index == last_block else len(self._blocks[index])
+            old_units.extend(self._blocks[index][low:high])
+            old_counts.extend(self._block_counts[index][low:high])
+
+        segment = "".join(old_units)
+        local_offset = offset - segment_start
+        segment = segment[:local_offset] + inserted + segment[local_offset + removed:]
+        new_units = split_units(segment) if segment else []
+        new_counts = [count_text(unit, self.language) for unit in new_units]
+        for old in old_counts:
+            for k in range(4):
+                self._totals[k] -= old[k]
+        for new in new_counts:
+            for k in range(4):
+                self._totals[k] += new[k]
+
+        units = self._blocks[first_block][:first_unit] + new_units + self._blocks[last_block][last_unit + 1:]
+        counts = (self._block_counts[first_block][:first_unit] + new_counts
+                  + self._block_counts[last_block][last_unit + 1:])
+        # Заменяемые блоки становятся одним или несколькими блоками не длиннее 2 * BLOCK_SIZE
+        parts = max(len(units) // BLOCK_SIZE, 1)
+        size = -(-len(units) // parts)
+        bounds = range(0, len(units), size) if units else range(0)
+        self._blocks[first_block:last_block + 1] = [units[i:i + size] for i in bounds]
+        self._block_counts[first_block:last_block + 1] = [counts[i:i + size] for i in bounds]
+        self._block_lengths[first_block:last_block + 1] = [sum(map(len, units[i:i + size])) for i in bounds]
+        if not self._blocks:
+            # Пустой текст - один блок с пустой единицей
+            self._blocks, self._block_counts, self._block_lengths = [[""]], [[(0, 0, 0, 0)]], [0]
+        self._length += len(inserted) - removed
+        if self._detect_language and offset < DETECTION_SAMPLE_SIZE:
+            language = detect_language(self._prefix(DETECTION_SAMPLE_SIZE))
+            if language != self.language:
+                self.language = language
+                self._recount()
+        return self.scores()
+
+    def _prefix(self, size: int) -> str:
+        """Первые size символов текста."""
+        parts: List[str] = []
+        collected = 0
+        for block, length in zip(self._blocks, self._block_lengths):
+            parts.extend(block)
+            collected += length
+            if collected >= size:
+                break
+        return "".join(parts)[:size]
+
+    def _recount(self) -> None:
+        """Пересчитывает счетчики всех предложений, например после смены языка."""
+        self._block_counts = [[count_text(unit, self.language) for unit in block] for block in self._blocks]
+        self._totals = [sum(c[k] for counts in self._block_counts for c in counts) for k in range(4)]
+
+    def _locate(self, position: int) -> Tuple[int, int, int]:
+        """
+        Находит единицу, содержащую символ с позицией position (позиция конца текста - последняя единица).
+
+        :return: tuple of (номер блока, номер единицы в блоке, позиция начала единицы)
+        """
+        start = 0
+        last_block = len(self._blocks) - 1
+        for index, length in enumerate(self._block_lengths):
+            if position < start + length or index == last_block:
+                break
+            start += length
+        block = self._blocks[index]
+        last_unit = len(block) - 1
+        for unit_index, unit in enumerate(block):
+            if position < start + len(unit) or unit_index == last_unit:
+                return index, unit_index, start
+            start += len(unit)
+        return index, last_unit, start
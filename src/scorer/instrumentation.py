@@ -0,0 +1,121 @@
+import io
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    import cProfile
+    import pstats
+
+
+class Instrumentation:
+    def __init__(self, exporter: Optional[Callable[[Dict], None]] = None, profile: bool = False):
+        """
+        Конструктор класса Instrumentation - таймеров этапов и счетчиков анализа.
+
+        Таймеры и счетчики накапливаются между запусками до вызова reset().
+        Без объекта Instrumentation анализатор не выполняет никаких замеров.
+
+        :param exporter: функция, получающая снимок статистики после каждого анализа
+        :param profile: профилировать следующий запуск анализа через cProfile
+        """
+        self.exporter = exporter
+        self.profile = profile
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._profiler: Optional["cProfile.Profile"] = None
+        self._profile_stats: Optional["pstats.Stats"] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Замеряет время выполнения этапа.
+
+        :param name: название этапа (read, tokenize, syllables, score, report, ...)
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """
+        Добавляет время этапа, замеренное в другом месте (например, в потоке чтения).
+
+        :param name: название этапа
+        :param seconds: время в секундах
+        """
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Увеличивает счетчик.
+
+        :param name: название счетчика
+        :param value: величина увеличения
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def profiled(self) -> Iterator[None]:
+        """Профилирует блок через cProfile, если включен режим profile; профилируется один запуск."""
+        if not self.profile or self._profiler is not None:
+            yield
+            return
+        # cProfile и pstats заметно замедляют запуск, поэтому импортируются только при профилировании
+        import cProfile
+        import pstats
+
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        try:
+            yield
+        finally:
+            self._profiler.disable()
+            self._profile_stats = pstats.Stats(self._profiler)
+            self.profile = False
+
+    def profile_report(self, limit: int = 20, sort: str = "cumulative") -> str:
+        """
+        Текстовый отчет cProfile по профилированному запуску.
+
+        :param limit: сколько функций показать
+        :param sort: ключ сортировки pstats
+        :return: отчет или пустая строка, если профилирования не было
+        """
+        if self._profile_stats is None:
+            return ""
+        stream = io.StringIO()
+        self._profile_stats.stream = stream
+        self._profile_stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def snapshot(self) -> Dict:
+        """
+        Текущие значения таймеров (в секундах) и счетчиков.
+
+        :return: словарь {"timings": ..., "counters": ...}
+        """
+        return {"timings": dict(self.timings), "counters": dict(self.counters)}
+
+    def merge(self, snapshot: Dict) -> None:
+        """
+        Добавляет снимок статистики, например полученный из другого процесса.
+
+        :param snapshot: результат snapshot()
+        """
+        for name, seconds in snapshot.get("timings", {}).items():
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+        for name, value in snapshot.get("counters", {}).items():
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def emit(self) -> None:
+        """Передает снимок статистики экспортеру, если он задан."""
+        if self.exporter is not None:
+            self.exporter(self.snapshot())
+
+    def reset(self) -> None:
+        """Обнуляет таймеры и счетчики."""
+        self.timings.clear()
+        self.counters.clear()
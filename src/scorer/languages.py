@@ -0,0 +1,80 @@
+import re
+from typing import Dict
+
+LATIN_VOWELS = 'aeiouy'
+CYRILLIC_VOWELS = 'аеёиоуыэюя'
+DETECTION_SAMPLE_SIZE = 10000
+
+_CYRILLIC_RE = re.compile(r'[а-яё]', re.IGNORECASE)
+_LATIN_RE = re.compile(r'[a-z]', re.IGNORECASE)
+
+
+class Language:
+    def __init__(self, code: str, vowels: str, complex_syllables: int, strip_chars: str = ".,:;"):
+        """
+        Конструктор класса Language - правил подсчета слогов для одного языка.
+
+        Слоги считаются по гласным предкомпилированным регулярным выражением,
+        без цикла по символам на Python.
+
+        :param code: код языка ("en", "ru")
+        :param vowels: гласные буквы в нижнем регистре
+        :param complex_syllables: с какого числа слогов слово считается сложным
+        :param strip_chars: знаки, отбрасываемые по краям слова
+        """
+        self.code = code
+        self.vowels = vowels
+        self.complex_syllables = complex_syllables
+        self.strip_chars = strip_chars
+        self._vowel_re = re.compile(f"[{re.escape(vowels)}]")
+        # Для подсчета по байтам UTF-8 без декодирования ASCII-слов
+        self.ascii_vowels = "".join(v for v in vowels if v.isascii()).encode('ascii')
+        self.strip_bytes = strip_chars.encode('ascii')
+
+    def count_syllables(self, word: str) -> int:
+        """Подсчет слогов в слове."""
+        word = word.lower().strip(self.strip_chars)
+        if not word:
+            return 0
+        return max(len(self._vowel_re.findall(word)), 1)
+
+    def is_complex(self, syllables: int) -> bool:
+        """Является ли слово с таким числом слогов сложным."""
+        return syllables >= self.complex_syllables
+
+
+LANGUAGES: Dict[str, Language] = {
+    # Для Gunning Fog сложными считаются слова из трех и более слогов
+    'en': Language('en', LATIN_VOWELS, complex_syllables=3),
+    # Русские слова в среднем длиннее, сложными принято считать слова из четырех и более слогов.
+    # Латинские гласные тоже учитываются, чтобы английские вставки не считались односложными.
+    'ru': Language('ru', CYRILLIC_VOWELS + LATIN_VOWELS, complex_syllables=4),
+}
+DEFAULT_LANGUAGE = 'en'
+
+
+def get_language(code: str) -> Language:
+    """
+    Возвращает правила для языка.
+
+    :param code: код языка
+    :return: объект Language
+    """
+    try:
+        return LANGUAGES[code]
+    except KeyError:
+        raise ValueError(f"Неподдерживаемый язык: {code}. Доступны: {', '.join(LANGUAGES)}") from None
+
+
+def detect_language(text: str, sample_size: int = DETECTION_SAMPLE_SIZE) -> str:
+    """
+    Определяет язык текста по преобладающему алфавиту в его начале.
+
+    :param text: исходный текст
+    :param sample_size: сколько первых символов учитывать
+    :return: код языка
+    """
+    sample = text[:sample_size]
+    if len(_CYRILLIC_RE.findall(sample)) > len(_LATIN_RE.findall(sample)):
+        return 'ru'
+    return DEFAULT_LANGUAGE
@@ -1,8 +1,5 @@
-from src.scorer.analyzer import TextAnalyzer
-from src.scorer.document_reader import DocumentReader
-from src.scorer.report import generate_report
-from src.scorer.simplifier import suggest_improvements, save_recommendations
 import os
+import sys
 
 # Определяем базовую директорию проекта
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,6 +11,8 @@ def get_recommendations_with_choice(results):
     """
     Получает рекомендации с выбором формата вывода
     """
+    from .simplifier import collect_improvements, suggest_improvements, save_recommendations
+
     print("\nФормат вывода рекомендаций:")
     print("1. Только в консоль")
     print("2. Только в JSON файл")
@@ -35,14 +34,7 @@ def get_recommendations_with_choice(results):
         print("=" * 50)
 
         # Сначала получаем рекомендации без вывода
-        improvements = []
-        if results["flesch_reading_ease"] < 60.0:
-            improvements.append("Используйте более короткие предложения.")
-            improvements.append("Избегайте сложных конструкций и длинных слов.")
-        if results["flesch_kincaid_grade_level"] >= 12:
-            improvements.append("Сделайте текст понятнее для широкой аудитории.")
-        if results["gunning_fog_index"] > 12:
-            improvements.append("Попробуйте упростить сложные слова и выражения.")
+        improvements = collect_improvements(results)
 
         if improvements:
             save_recommendations(results, improvements)
@@ -69,6 +61,15 @@ def get_recommendations_with_choice(results):
 
 
 def main():
+    # С аргументами командной строки - неинтерактивный режим, меню и отчеты не загружаются
+    if len(sys.argv) > 1:
+        from .cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
+    from .analyzer import TextAnalyzer
+    from .document_reader import DocumentReader
+    from .report import generate_report
+
     print("Анализатор читаемости текста")
     print("=" * 50)
 
@@ -1,5 +1,15 @@
 import re
-from typing import Tuple, Dict
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Mapping, Optional, Tuple
+from .languages import DEFAULT_LANGUAGE, DETECTION_SAMPLE_SIZE, detect_language, get_language
+from .results import ReadabilityResult
+
+# Увеличивается при любом изменении расчета, чтобы сбросить сохраненные результаты
+METRICS_VERSION = "3"
+SENTENCE_END_RE = re.compile(r'[.?!]+')
+SENTENCE_END_BYTES_RE = re.compile(rb'[.?!]+')
+SYLLABLE_CACHE_SIZE = 65536
 
 
 def count_words(text: str) -> int:
@@ -10,18 +20,44 @@ def count_words(text: str) -> int:
 
 def count_sentences(text: str) -> int:
     """Подсчет количества предложений."""
-    sentences = re.findall(r'[.?!]+', text)
+    sentences = SENTENCE_END_RE.findall(text)
     return len(sentences)
 
 
-def count_syllables(word: str) -> int:
-    """Подсчет слогов в слове."""
-    vowels = 'aeiouy'
-    word = word.lower().strip(".,:;")
-    if not word:
-        return 0
-    num_vowels = sum([1 for char in word if char in vowels])
-    return max(num_vowels, 1)
+def _count_syllables_uncached(word: str, language: str) -> int:
+    return get_language(language).count_syllables(word)
+
+
+_syllable_cache = lru_cache(maxsize=SYLLABLE_CACHE_SIZE)(_count_syllables_uncached)
+
+
+def count_syllables(word: str, language: str = DEFAULT_LANGUAGE) -> int:
+    """Подсчет слогов в слове (с кэшированием по исходному слову и языку)."""
+    return _syllable_cache(word, language)
+
+
+def configure_syllable_cache(maxsize: int) -> None:
+    """
+    Пересоздает кэш слогов с новым размером; накопленные записи сбрасываются.
+
+    :param maxsize: максимальное число слов в кэше (вытесняются давно не использованные)
+    """
+    global _syllable_cache
+    _syllable_cache = lru_cache(maxsize=maxsize)(_count_syllables_uncached)
+
+
+def syllable_cache_info():
+    """
+    Статистика кэша слогов.
+
+    :return: named tuple (hits, misses, maxsize, currsize)
+    """
+    return _syllable_cache.cache_info()
+
+
+def clear_syllable_cache() -> None:
+    """Очищает кэш слогов и его статистику."""
+    _syllable_cache.cache_clear()
 
 
 def calculate_flesch_reading_ease(total_words: int, total_sentences: int, syllable_count: int) -> float:
@@ -41,49 +77,226 @@ def calculate_gunning_fog_index(total_words: int, complex_word_count: int, total
     return 0.4 * (avg_sentence_length + percent_complex_words)
 
 
-def is_complex_word(word: str) -> bool:
-    """Проверка является ли слово сложным (более двух слогов)."""
-    return count_syllables(word) > 2
+def is_complex_word(word: str, language: str = DEFAULT_LANGUAGE) -> bool:
+    """Проверка является ли слово сложным (для английского - более двух слогов)."""
+    return get_language(language).is_complex(count_syllables(word, language))
+
+
+def count_text(text: str, language: Optional[str] = None) -> Tuple[int, int, int, int]:
+    """
+    Подсчитывает слова, предложения, слоги и сложные слова за один проход по тексту.
+
+    Знаки конца предложения не содержат пробелов, поэтому каждая их серия целиком
+    лежит внутри одного слова, и предложения можно считать по словам. Слова
+    сначала сводятся в таблицу частот, так что слоги считаются один раз на
+    каждое различное слово, а не на каждое вхождение.
+
+    :param text: исходный текст
+    :param language: код языка (по умолчанию определяется по тексту)
+    :return: tuple of (words, sentences, syllables, complex_words)
+    """
+    if language is None:
+        language = detect_language(text)
+    return count_frequencies(Counter(text.split()), language)
+
+
+def count_frequencies(frequencies: Mapping[str, int],
+                      language: str = DEFAULT_LANGUAGE) -> Tuple[int, int, int, int]:
+    """
+    Подсчитывает слова, предложения, слоги и сложные слова по таблице частот слов.
+
+    :param frequencies: слово -> число вхождений
+    :param language: код языка
+    :return: tuple of (words, sentences, syllables, complex_words)
+    """
+    complex_syllables = get_language(language).complex_syllables
+    words = sentences = syllables = complex_words = 0
+    for word, occurrences in frequencies.items():
+        words += occurrences
+        sentences += occurrences * len(SENTENCE_END_RE.findall(word))
+        word_syllables = count_syllables(word, language)
+        syllables += occurrences * word_syllables
+        if word_syllables >= complex_syllables:
+            complex_words += occurrences
+    return words, sentences, syllables, complex_words
+
+
+def count_syllables_bytes(word: bytes, language: str = DEFAULT_LANGUAGE) -> int:
+    """
+    Подсчет слогов в слове в кодировке UTF-8 без декодирования ASCII-слов.
+
+    Слова с не-ASCII символами декодируются и считаются через count_syllables.
+    """
+    if not word.isascii():
+        return count_syllables(word.decode('utf-8', errors='replace'), language)
+    rules = get_language(language)
+    word = word.lower().strip(rules.strip_bytes)
+    if not word:
+        return 0
+    num_vowels = len(word) - len(word.translate(None, rules.ascii_vowels))
+    return max(num_vowels, 1)
+
 
+def count_bytes_frequencies(frequencies: Mapping[bytes, int],
+                            language: str = DEFAULT_LANGUAGE) -> Tuple[int, int, int, int]:
+    """
+    То же, что count_frequencies, но для слов в виде байтов UTF-8.
 
-def extract_metrics(text: str) -> Tuple[int, int, int]:
+    :param frequencies: слово -> число вхождений
+    :param language: код языка
+    :return: tuple of (words, sentences, syllables, complex_words)
+    """
+    complex_syllables = get_language(language).complex_syllables
+    words = sentences = syllables = complex_words = 0
+    for word, occurrences in frequencies.items():
+        words += occurrences
+        sentences += occurrences * len(SENTENCE_END_BYTES_RE.findall(word))
+        word_syllables = count_syllables_bytes(word, language)
+        syllables += occurrences * word_syllables
+        if word_syllables >= complex_syllables:
+            complex_words += occurrences
+    return words, sentences, syllables, complex_words
+
+
+class TextCounter:
+    """Накапливает счетчики count_text по частям текста, поступающим потоком."""
+
+    def __init__(self, language: Optional[str] = None):
+        """
+        Конструктор класса TextCounter.
+
+        :param language: код языка (по умолчанию определяется, как в count_text, по первым
+            DETECTION_SAMPLE_SIZE символам текста)
+        """
+        self.language = language
+        self.words = 0
+        self.sentences = 0
+        self.syllables = 0
+        self.complex_words = 0
+        self._tail = ""
+
+    def feed(self, chunk: str) -> None:
+        """
+        Добавляет очередную часть текста.
+
+        Незавершенное слово в конце части откладывается до следующего вызова,
+        поэтому слова и серии знаков препинания на стыке частей не разрываются.
+        Пока язык не задан, части накапливаются, пока их не наберется
+        DETECTION_SAMPLE_SIZE символов, - язык определяется по той же выборке,
+        что и для всего текста сразу.
+
+        :param chunk: часть текста
+        """
+        text = self._tail + chunk
+        if self.language is None:
+            if len(text) < DETECTION_SAMPLE_SIZE:
+                self._tail = text
+                return
+            self.language = detect_language(text)
+        split_at = len(text)
+        while split_at > 0 and not text[split_at - 1].isspace():
+            split_at -= 1
+        self._tail = text[split_at:]
+        self._add(count_text(text[:split_at], self.language))
+
+    def finish(self) -> Tuple[int, int, int, int]:
+        """
+        Учитывает отложенное слово и возвращает итоговые счетчики.
+
+        :return: tuple of (words, sentences, syllables, complex_words)
+        """
+        if self.language is None:
+            self.language = detect_language(self._tail)
+        if self._tail:
+            self._add(count_text(self._tail, self.language))
+            self._tail = ""
+        return self.words, self.sentences, self.syllables, self.complex_words
+
+    def _add(self, counts: Tuple[int, int, int, int]) -> None:
+        self.words += counts[0]
+        self.sentences += counts[1]
+        self.syllables += counts[2]
+        self.complex_words += counts[3]
+
+
+def extract_metrics(text: str, language: Optional[str] = None) -> Tuple[int, int, int]:
     """
     Возвращает кортеж из общего числа слов, предложений и сложных слов.
 
     :param text: исходный текст
+    :param language: код языка (по умолчанию определяется по тексту)
     :return: tuple of (words, sentences, complex_words)
     """
-    words = count_words(text)
-    sentences = count_sentences(text)
-    complex_words = sum(is_complex_word(w) for w in text.split())
+    words, sentences, _, complex_words = count_text(text, language)
     return words, sentences, complex_words
 
 
-def select_metrics(analysis_results: Dict[str, float], metric_choice: str = "all") -> Dict[str, float]:
+def calculate_scores(total_words: int, total_sentences: int, syllable_count: int,
+                     complex_word_count: int) -> ReadabilityResult:
+    """
+    Вычисляет все три индекса читаемости по готовым счетчикам.
+
+    :return: результат с метриками и счетчиками (ведет себя как словарь метрик)
+    """
+    return ReadabilityResult(
+        total_words, total_sentences, syllable_count, complex_word_count,
+        calculate_flesch_reading_ease(total_words, total_sentences, syllable_count),
+        calculate_flesch_kincaid_grade_level(total_words, total_sentences, syllable_count),
+        calculate_gunning_fog_index(total_words, complex_word_count, total_sentences)
+    )
+
+
+def score_text(text: str, language: Optional[str] = None) -> ReadabilityResult:
+    """
+    Вычисляет индексы читаемости для строки текста.
+
+    :param text: исходный текст
+    :param language: код языка (по умолчанию определяется по тексту)
+    :return: результат с метриками и счетчиками
+    """
+    return calculate_scores(*count_text(text, language))
+
+
+_METRIC_CHOICES = {
+    "flesch": "flesch_reading_ease",
+    "kincaid": "flesch_kincaid_grade_level",
+    "gunning": "gunning_fog_index",
+}
+
+
+def calculate_average_readability(flesch_reading_ease, flesch_kincaid_grade_level, gunning_fog_index):
+    """
+    Средний показатель читаемости: Kincaid и Gunning Fog приводятся к шкале Флеша.
+
+    Работает как со скалярами, так и с массивами NumPy.
+    """
+    return (
+                   flesch_reading_ease +
+                   (100 - flesch_kincaid_grade_level * 6.67) +  # Нормализация Kincaid
+                   (100 - gunning_fog_index * 8.33)  # Нормализация Gunning Fog
+           ) / 3
+
+
+def select_metrics(analysis_results: Mapping[str, float], metric_choice: str = "all") -> Dict[str, float]:
     """
     Возвращает выбранные пользователем метрики или их среднее.
 
-    :param analysis_results: словарь со всеми метриками
+    Вычисляется только запрошенное представление; среднее считается лишь для "average".
+
+    :param analysis_results: результат анализа (ReadabilityResult или словарь со всеми метриками)
     :param metric_choice: выбор метрики ("flesch", "kincaid", "gunning", "average", "all")
     :return: словарь с выбранными метриками
     """
-    choices = {
-        "flesch": {"flesch_reading_ease": analysis_results["flesch_reading_ease"]},
-        "kincaid": {"flesch_kincaid_grade_level": analysis_results["flesch_kincaid_grade_level"]},
-        "gunning": {"gunning_fog_index": analysis_results["gunning_fog_index"]},
-        "average": {
-            "average_readability": (
-                                           analysis_results["flesch_reading_ease"] +
-                                           (100 - analysis_results[
-                                               "flesch_kincaid_grade_level"] * 6.67) +  # Нормализация Kincaid
-                                           (100 - analysis_results["gunning_fog_index"] * 8.33)
-                                   # Нормализация Gunning Fog
-                                   ) / 3
-        },
-        "all": analysis_results
-    }
-
-    return choices.get(metric_choice, analysis_results)
+    if metric_choice == "average":
+        return {
+            "average_readability": calculate_average_readability(analysis_results["flesch_reading_ease"],
+                                                                 analysis_results["flesch_kincaid_grade_level"],
+                                                                 analysis_results["gunning_fog_index"])
+        }
+    metric = _METRIC_CHOICES.get(metric_choice)
+    if metric is not None:
+        return {metric: analysis_results[metric]}
+    return dict(analysis_results)
 
 
 def show_metric_selection_menu() -> str:
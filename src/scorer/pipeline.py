@@ -0,0 +1,87 @@
+import hashlib
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, Iterable, Iterator, Optional, Tuple
+
+from .document_reader import DEFAULT_CHUNK_SIZE, DocumentReader
+
+DEFAULT_IO_WORKERS = 8
+DEFAULT_QUEUE_DEPTH = 32
+
+
+class PrefetchedDocument(DocumentReader):
+    def __init__(self, file_path: str, text: str, size: int, digest: Optional[str] = None):
+        """
+        Конструктор класса PrefetchedDocument - документа, уже прочитанного потоком предвыборки.
+
+        :param file_path: путь к файлу
+        :param text: декодированный текст
+        :param size: размер файла в байтах
+        :param digest: SHA-256 содержимого, если он был посчитан при чтении
+        """
+        super().__init__(file_path)
+        self.text = text
+        self.digest = digest
+        self._size = size
+
+    def read_text(self) -> str:
+        return self.text
+
+    def content_hash(self, block_size: int = DEFAULT_CHUNK_SIZE) -> str:
+        if self.digest is None:
+            return super().content_hash(block_size)
+        return self.digest
+
+    def size(self) -> int:
+        return self._size
+
+
+def prefetch_document(file_path: str, with_hash: bool = False) -> Tuple[PrefetchedDocument, float]:
+    """
+    Читает, распаковывает и декодирует файл (выполняется в потоке предвыборки).
+
+    Чтение, распаковка и хэширование больших блоков отпускают GIL, поэтому идут параллельно
+    с анализом в основном потоке.
+
+    :param file_path: путь к файлу
+    :param with_hash: сразу посчитать хэш содержимого для кэша результатов
+    :return: документ и время чтения в секундах
+    """
+    started = time.perf_counter()
+    with DocumentReader(file_path).open_binary() as stream:
+        data = stream.read()
+    digest = hashlib.sha256(data).hexdigest() if with_hash else None
+    document = PrefetchedDocument(file_path, data.decode('utf-8'), len(data), digest)
+    return document, time.perf_counter() - started
+
+
+def iter_prefetched(paths: Iterable[str], io_workers: int = DEFAULT_IO_WORKERS,
+                    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+                    with_hash: bool = False) -> Iterator[Tuple[str, Future]]:
+    """
+    Читает файлы пулом потоков с опережением не больше queue_depth документов.
+
+    Новый файл ставится в очередь только после того, как потребитель забрал
+    очередной результат, поэтому медленный анализ не приводит к накоплению
+    прочитанных текстов в памяти.
+
+    :param paths: пути к файлам
+    :param io_workers: число потоков чтения
+    :param queue_depth: сколько документов может быть прочитано заранее
+    :param with_hash: считать хэш содержимого при чтении
+    :return: итератор пар (путь, future с результатом prefetch_document) в порядке путей
+    """
+    if queue_depth < 1:
+        raise ValueError("Глубина очереди должна быть положительной")
+    paths = iter(paths)
+    with ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="prefetch") as executor:
+        pending: Deque[Tuple[str, Future]] = deque(
+            (path, executor.submit(prefetch_document, path, with_hash)) for path in islice(paths, queue_depth))
+        while pending:
+            path, future = pending.popleft()
+            next_path = next(paths, None)
+            if next_path is not None:
+                pending.append((next_path, executor.submit(prefetch_document, next_path, with_hash)))
+            yield path, future
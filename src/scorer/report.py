@@ -1,16 +1,44 @@
 import json
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
-from src.scorer.analyzer import TextAnalyzer
-from src.scorer.metrics import select_metrics, show_metric_selection_menu
+from .sinks import ReportSink
 
 
-def generate_report(analysis_results: Dict[str, float], output_format: str = "text") -> str:
+def build_report_record(analysis_results: Dict[str, float], source: Optional[str] = None) -> Dict:
+    """
+    Формирует структурированный отчет по одному документу.
+
+    :param analysis_results: словарь с результатом анализа
+    :param source: имя проанализированного документа
+    :return: словарь с метриками и их интерпретацией
+    """
+    report_data = {
+        "timestamp": datetime.now().isoformat(),
+        "metrics": {
+            "flesch_reading_ease": round(analysis_results['flesch_reading_ease'], 2),
+            "flesch_kincaid_grade_level": round(analysis_results['flesch_kincaid_grade_level'], 2),
+            "gunning_fog_index": round(analysis_results['gunning_fog_index'], 2)
+        },
+        "interpretation": {
+            "flesch_reading_ease": _interpret_flesch(analysis_results['flesch_reading_ease']),
+            "flesch_kincaid_grade_level": _interpret_kincaid(analysis_results['flesch_kincaid_grade_level']),
+            "gunning_fog_index": _interpret_gunning_fog(analysis_results['gunning_fog_index'])
+        }
+    }
+    if source is not None:
+        report_data = {"source": source, **report_data}
+    return report_data
+
+
+def generate_report(analysis_results: Dict[str, float], output_format: str = "text",
+                    sink: Optional[ReportSink] = None, source: Optional[str] = None) -> str:
     """
     Генерирует отчёт по проведённому анализу текста.
 
     :param analysis_results: словарь с результатом анализа
     :param output_format: формат вывода ("text", "json", или "both")
+    :param sink: общий файл записей; если задан, JSON-отчет добавляется в него, а не в отдельный файл
+    :param source: имя документа для записи в sink
     :return: строка с отчетом (пустая для JSON-файла)
     """
     report_text = ""
@@ -23,22 +51,14 @@ def generate_report(analysis_results: Dict[str, float], output_format: str = "te
 
     if output_format in ["json", "both"]:
         # Создаем структурированный отчет для JSON
-        report_data = {
-            "timestamp": datetime.now().isoformat(),
-            "metrics": {
-                "flesch_reading_ease": round(analysis_results['flesch_reading_ease'], 2),
-                "flesch_kincaid_grade_level": round(analysis_results['flesch_kincaid_grade_level'], 2),
-                "gunning_fog_index": round(analysis_results['gunning_fog_index'], 2)
-            },
-            "interpretation": {
-                "flesch_reading_ease": _interpret_flesch(analysis_results['flesch_reading_ease']),
-                "flesch_kincaid_grade_level": _interpret_kincaid(analysis_results['flesch_kincaid_grade_level']),
-                "gunning_fog_index": _interpret_gunning_fog(analysis_results['gunning_fog_index'])
-            }
-        }
+        report_data = build_report_record(analysis_results, source)
+
+        if sink is not None:
+            sink.write(report_data)
+            return report_text
 
-        # Генерируем имя файла с временной меткой
-        filename = f"readability_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        # Генерируем имя файла с временной меткой (с микросекундами, чтобы файлы не перезаписывались)
+        filename = f"readability_report_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json"
 
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(report_data, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+from typing import Optional
+
+from .metrics import METRICS_VERSION
+from .results import ReadabilityResult
+
+
+class ResultCache:
+    def __init__(self, directory: str, max_entries: int = 100_000):
+        """
+        Конструктор класса ResultCache - дискового кэша результатов анализа.
+
+        Ключ записи - хэш содержимого документа и версия движка метрик, поэтому
+        после изменения расчета старые записи просто перестают находиться.
+        При переполнении удаляются записи, к которым дольше всего не обращались.
+
+        :param directory: директория для файлов кэша
+        :param max_entries: максимальное число записей
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: Optional[int] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def key_for(self, content_hash: str) -> str:
+        """
+        Формирует ключ записи.
+
+        :param content_hash: хэш содержимого документа
+        :return: ключ записи
+        """
+        return hashlib.sha256(f"{METRICS_VERSION}:{content_hash}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[ReadabilityResult]:
+        """
+        Возвращает сохраненный результат или None.
+
+        :param key: ключ записи
+        :return: результат с метриками и счетчиками
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                results = ReadabilityResult.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        # Обновляем время доступа для вытеснения давно не использованных записей
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return results
+
+    def put(self, key: str, results: ReadabilityResult) -> None:
+        """
+        Сохраняет результат анализа вместе со счетчиками.
+
+        :param key: ключ записи
+        :param results: результат анализа
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(results.to_dict(include_counts=True), f)
+        existed = os.path.exists(path)
+        os.replace(tmp_path, path)
+        if self._entries is None:
+            self._entries = self._count_entries()
+        elif not existed:
+            self._entries += 1
+        if self._entries > self.max_entries:
+            self._evict()
+
+    def clear(self) -> None:
+        """Удаляет все записи кэша."""
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.directory, name))
+        self._entries = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _count_entries(self) -> int:
+        return sum(1 for name in os.listdir(self.directory) if name.endswith('.json'))
+
+    def _evict(self) -> None:
+        """Удаляет давно не использованные записи, оставляя 90% от лимита."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.json'):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+        entries.sort()
+        excess = len(entries) - int(self.max_entries * 0.9)
+        for _, path in entries[:max(excess, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._entries = len(entries) - max(excess, 0)
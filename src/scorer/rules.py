@@ -0,0 +1,149 @@
+import operator
+from functools import lru_cache
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# Категории рекомендаций в порядке вывода
+CATEGORIES = ("flesch_reading_ease", "flesch_kincaid", "gunning_fog", "overall", "positive")
+
+_OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class Recommendation(NamedTuple):
+    """Рекомендация по улучшению текста."""
+    category: str
+    message: str
+
+
+class Rule(NamedTuple):
+    """
+    Правило: если выполнены все условия (метрика, оператор, порог), выдаются сообщения.
+
+    Порог None задается при проверке параметром min_readability_score.
+    """
+    rule_id: str
+    category: str
+    conditions: Tuple[Tuple[str, str, Optional[float]], ...]
+    messages: Tuple[str, ...]
+
+
+RULES: Tuple[Rule, ...] = (
+    Rule("low_reading_ease", "flesch_reading_ease", (("flesch_reading_ease", "<", None),), (
+        "Используйте более короткие предложения.",
+        "Избегайте сложных конструкций и длинных слов.",
+        "Разбейте длинные предложения на несколько коротких.",
+        "Используйте активный залог вместо пассивного.",
+    )),
+    Rule("high_grade_level", "flesch_kincaid", (("flesch_kincaid_grade_level", ">=", 12),), (
+        "Сделайте текст понятнее для широкой аудитории.",
+        "Замените специальные термины на общеупотребительные слова.",
+        "Добавьте пояснения к сложным понятиям.",
+        "Используйте примеры для иллюстрации сложных идей.",
+    )),
+    Rule("high_fog", "gunning_fog", (("gunning_fog_index", ">", 12),), (
+        "Попробуйте упростить сложные слова и выражения.",
+        "Сократите количество слов с тремя и более слогами.",
+        "Используйте синонимы с меньшим количеством слогов.",
+        "Избегайте цепочек прилагательных и наречий.",
+    )),
+    Rule("rewrite", "overall", (("flesch_reading_ease", "<", 50), ("gunning_fog_index", ">", 15)), (
+        "Текст слишком сложен. Рассмотрите возможность полного переписывания.",
+        "Определите целевую аудиторию и адаптируйте текст под её уровень.",
+    )),
+    Rule("higher_education", "flesch_kincaid", (("flesch_kincaid_grade_level", ">", 15),), (
+        "Текст требует высшего образования для понимания. Упростите.",
+        "Добавьте краткое содержание или аннотацию в начале.",
+    )),
+    Rule("balanced", "positive", (("flesch_reading_ease", ">=", 70),), (
+        "Текст хорошо сбалансирован по сложности.",
+    )),
+    Rule("accessible_grade", "positive", (("flesch_kincaid_grade_level", "<", 10),), (
+        "Уровень сложности подходит для большинства читателей.",
+    )),
+    Rule("optimal_complex_words", "positive", (("gunning_fog_index", "<", 10),), (
+        "Использование сложных слов оптимально.",
+    )),
+)
+
+CompiledRule = Tuple[Tuple[Tuple[str, Callable[[float, float], bool], float], ...], Tuple[Recommendation, ...]]
+
+
+@lru_cache(maxsize=32)
+def compile_rules(min_readability_score: float = 60.0) -> Tuple[CompiledRule, ...]:
+    """
+    Предкомпилирует таблицу правил: операторы становятся функциями, сообщения - объектами Recommendation.
+
+    :param min_readability_score: порог для условий без заданного порога (None в таблице)
+    :return: кортеж пар (условия, рекомендации)
+    """
+    compiled = []
+    for rule in RULES:
+        conditions = []
+        for metric, op, threshold in rule.conditions:
+            if threshold is None:
+                threshold = min_readability_score
+            conditions.append((metric, _OPERATORS[op], threshold))
+        recommendations = tuple(Recommendation(rule.category, message) for message in rule.messages)
+        compiled.append((tuple(conditions), recommendations))
+    return tuple(compiled)
+
+
+def evaluate_rules(results: Mapping[str, float], min_readability_score: float = 60.0) -> List[Recommendation]:
+    """
+    Проверяет все правила для одного результата анализа.
+
+    :param results: словарь с метриками
+    :param min_readability_score: минимальный порог удобства чтения
+    :return: список рекомендаций в порядке таблицы правил
+    """
+    recommendations: List[Recommendation] = []
+    for conditions, rule_recommendations in compile_rules(min_readability_score):
+        if all(op(results[metric], threshold) for metric, op, threshold in conditions):
+            recommendations.extend(rule_recommendations)
+    return recommendations
+
+
+def evaluate_rules_batch(columns: Mapping[str, Sequence[float]],
+                         min_readability_score: float = 60.0) -> List[List[Recommendation]]:
+    """
+    Проверяет все правила для пакета результатов, обрабатывая каждую метрику столбцом.
+
+    Столбцы могут быть списками или массивами NumPy (например, результатом score_batch);
+    для массивов сравнения выполняются векторно.
+
+    :param columns: метрика -> значения по документам
+    :param min_readability_score: минимальный порог удобства чтения
+    :return: списки рекомендаций по документам
+    """
+    size = len(next(iter(columns.values()))) if columns else 0
+    per_document: List[List[Recommendation]] = [[] for _ in range(size)]
+    for conditions, rule_recommendations in compile_rules(min_readability_score):
+        mask = None
+        for metric, op, threshold in conditions:
+            values = columns[metric]
+            if hasattr(values, "__array__"):
+                condition = op(values, threshold)
+            else:
+                condition = [op(v, threshold) for v in values]
+            mask = condition if mask is None else [a and b for a, b in zip(mask, condition)]
+        for index, matched in enumerate(mask):
+            if matched:
+                per_document[index].extend(rule_recommendations)
+    return per_document
+
+
+def count_by_category(recommendations: Sequence[Recommendation]) -> Dict[str, int]:
+    """
+    Считает рекомендации по категориям.
+
+    :param recommendations: список рекомендаций
+    :return: категория -> число рекомендаций (для всех категорий)
+    """
+    counts = dict.fromkeys(CATEGORIES, 0)
+    for recommendation in recommendations:
+        counts[recommendation.category] = counts.get(recommendation.category, 0) + 1
+    return counts
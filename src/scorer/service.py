@@ -0,0 +1,266 @@
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from .metrics import score_text
+from .results import ResultColumns
+from .rules import evaluate_rules_batch
+
+MAX_BODY_SIZE = 16 * 1024 * 1024
+LATENCY_WINDOW = 10000
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+def score_texts(texts: List[str]) -> List[Dict]:
+    """
+    Оценивает пачку текстов в рабочем процессе.
+
+    :param texts: список текстов
+    :return: метрики и рекомендации по каждому тексту (или описание ошибки)
+    """
+    scored: List[Dict] = []
+    valid: List[Dict] = []
+    columns = ResultColumns()
+    for text in texts:
+        try:
+            results = score_text(text)
+        except ZeroDivisionError:
+            scored.append({"error": "В тексте нет слов или предложений"})
+            continue
+        entry = {"metrics": results.to_dict()}
+        scored.append(entry)
+        valid.append(entry)
+        columns.append(results)
+
+    # Правила рекомендаций проверяются сразу для всей пачки
+    for entry, improvements in zip(valid, evaluate_rules_batch(columns.metric_columns())):
+        entry["improvements"] = [r._asdict() for r in improvements]
+    return scored
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Процентиль методом ближайшего ранга."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(percent / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class ScoringService:
+    def __init__(self, executor: Optional[Executor] = None, max_batch: int = 64,
+                 max_delay: float = 0.005, max_inflight_batches: int = 4):
+        """
+        Конструктор класса ScoringService - HTTP-сервиса оценки читаемости.
+
+        Одновременные запросы собираются в пачки (до max_batch текстов или
+        max_delay секунд ожидания), и каждая пачка оценивается в пуле процессов,
+        поэтому цикл событий не блокируется расчетами.
+
+        :param executor: пул для расчетов (по умолчанию ProcessPoolExecutor)
+        :param max_batch: максимальный размер пачки
+        :param max_delay: максимальное ожидание добора пачки в секундах
+        :param max_inflight_batches: сколько пачек может обрабатываться одновременно
+        """
+        self.executor = executor or ProcessPoolExecutor()
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_inflight_batches = max_inflight_batches
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.requests_served = 0
+        self.batches_processed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Semaphore] = None
+        # Ссылки на задачи пачек: без них задачи могут быть собраны сборщиком мусора
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """
+        Запускает сборщик пачек и HTTP-сервер.
+
+        :param host: адрес для прослушивания
+        :param port: порт
+        :return: объект сервера asyncio
+        """
+        self._queue = asyncio.Queue()
+        self._inflight = asyncio.Semaphore(self.max_inflight_batches)
+        self._batcher = asyncio.create_task(self._batch_loop())
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def stop(self) -> None:
+        """Останавливает сборщик пачек, отменяет обрабатываемые пачки и останавливает пул процессов."""
+        tasks = list(self._batch_tasks)
+        if self._batcher is not None:
+            tasks.append(self._batcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def score(self, texts: List[str]) -> List[Dict]:
+        """
+        Ставит тексты в очередь на оценку и ждет результатов.
+
+        :param texts: список текстов
+        :return: результаты в порядке входных текстов
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._queue.put_nowait((text, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    def stats(self) -> Dict:
+        """
+        Статистика сервиса с процентилями задержки по последним запросам.
+
+        :return: словарь со статистикой (задержки в миллисекундах)
+        """
+        ordered = sorted(self.latencies)
+        return {
+            "requests": self.requests_served,
+            "batches": self.batches_processed,
+            "latency_ms": {
+                "p50": round(_percentile(ordered, 50) * 1000, 3),
+                "p90": round(_percentile(ordered, 90) * 1000, 3),
+                "p99": round(_percentile(ordered, 99) * 1000, 3),
+                "max": round(ordered[-1] * 1000, 3) if ordered else 0.0
+            }
+        }
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._inflight.acquire()
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            scored = await loop.run_in_executor(self.executor, score_texts, [text for text, _ in batch])
+            for (_, future), result in zip(batch, scored):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # При отмене пачки ожидающие ее запросы тоже отменяются
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+            self.batches_processed += 1
+            self._inflight.release()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        started = time.perf_counter()
+        try:
+            status, payload = await self._handle_request(reader)
+        except Exception as e:
+            status, payload = 500, {"error": str(e)}
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode('ascii') + body
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+        self.requests_served += 1
+        self.latencies.append(time.perf_counter() - started)
+
+    async def _handle_request(self, reader: asyncio.StreamReader) -> Tuple[int, Dict]:
+        request_line = (await reader.readline()).decode('latin-1').split()
+        if len(request_line) < 2:
+            return 400, {"error": "Некорректный запрос"}
+        method, path = request_line[0], request_line[1]
+
+        content_length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            if name.strip().lower() == "content-length":
+                value = value.strip()
+                if not value.isdigit():
+                    return 400, {"error": "Некорректный заголовок Content-Length"}
+                content_length = int(value)
+
+        if path == "/stats":
+            return 200, self.stats()
+        if path != "/score":
+            return 404, {"error": f"Неизвестный путь: {path}"}
+        if method != "POST":
+            return 405, {"error": "Используйте POST"}
+        if content_length > MAX_BODY_SIZE:
+            return 413, {"error": "Слишком большой запрос"}
+
+        try:
+            request = json.loads(await reader.readexactly(content_length))
+        except (ValueError, asyncio.IncompleteReadError):
+            return 400, {"error": "Тело запроса должно быть JSON"}
+
+        if not isinstance(request, dict):
+            return 400, {"error": "Тело запроса должно быть JSON-объектом"}
+        texts = request.get("texts")
+        if isinstance(texts, list):
+            if not all(isinstance(t, str) for t in texts):
+                return 400, {"error": "Поле 'texts' должно быть списком строк"}
+            return 200, {"results": await self.score(texts)}
+        if isinstance(request.get("text"), str):
+            return 200, (await self.score([request["text"]]))[0]
+        return 400, {"error": "Ожидается поле 'text' или 'texts'"}
+
+
+async def serve(host: str, port: int, workers: Optional[int], max_batch: int, max_delay: float) -> None:
+    service = ScoringService(ProcessPoolExecutor(max_workers=workers), max_batch, max_delay)
+    server = await service.start(host, port)
+    print(f"Сервис оценки читаемости запущен: http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="HTTP-сервис оценки читаемости текста.")
+    parser.add_argument("--host", default="127.0.0.1", help="адрес для прослушивания")
+    parser.add_argument("--port", type=int, default=8080, help="порт")
+    parser.add_argument("--workers", type=int, default=None, help="число рабочих процессов")
+    parser.add_argument("--max-batch", type=int, default=64, help="максимальный размер пачки")
+    parser.add_argument("--max-delay-ms", type=float, default=5.0, help="ожидание добора пачки, мс")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_batch, args.max_delay_ms / 1000))
+    except KeyboardInterrupt:
+        print("Сервис остановлен.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,97 +1,89 @@
-from typing import Dict
+from typing import Dict, List, Optional
 import json
 from datetime import datetime
+from .rules import Recommendation, count_by_category, evaluate_rules
+from .sinks import ReportSink
+
+
+def collect_improvements(results: Dict[str, float], min_readability_score: float = 60.0) -> List[Recommendation]:
+    """
+    Формирует список конкретных рекомендаций по улучшению читаемости текста без вывода.
+
+    Рекомендации берутся из таблицы правил rules.RULES.
+
+    :param results: словарь с результатами анализа
+    :param min_readability_score: минимальный порог удобства чтения
+    :return: список рекомендаций с категориями
+    """
+    return evaluate_rules(results, min_readability_score)
 
 
 def suggest_improvements(results: Dict[str, float], min_readability_score: float = 60.0,
-                         show_json: bool = True) -> None:
+                         show_json: bool = True, sink: Optional[ReportSink] = None) -> None:
     """
-    Формирует список конкретных рекомендаций по улучшению читаемости текста.
+    Формирует и выводит список конкретных рекомендаций по улучшению читаемости текста.
 
     :param results: словарь с результатами анализа
     :param min_readability_score: минимальный порог удобства чтения
     :param show_json: сохранять ли рекомендации в JSON файл
+    :param sink: общий файл записей для сохранения вместо отдельного JSON файла
     """
-    improvements = []
-
-    # Рекомендации на основе Flesch Reading Ease
-    if results["flesch_reading_ease"] < min_readability_score:
-        improvements.append("Используйте более короткие предложения.")
-        improvements.append("Избегайте сложных конструкций и длинных слов.")
-        improvements.append("Разбейте длинные предложения на несколько коротких.")
-        improvements.append("Используйте активный залог вместо пассивного.")
-
-    # Рекомендации на основе Flesch-Kincaid Grade Level
-    if results["flesch_kincaid_grade_level"] >= 12:
-        improvements.append("Сделайте текст понятнее для широкой аудитории.")
-        improvements.append("Замените специальные термины на общеупотребительные слова.")
-        improvements.append("Добавьте пояснения к сложным понятиям.")
-        improvements.append("Используйте примеры для иллюстрации сложных идей.")
-
-    # Рекомендации на основе Gunning Fog Index
-    if results["gunning_fog_index"] > 12:
-        improvements.append("Попробуйте упростить сложные слова и выражения.")
-        improvements.append("Сократите количество слов с тремя и более слогами.")
-        improvements.append("Используйте синонимы с меньшим количеством слогов.")
-        improvements.append("Избегайте цепочек прилагательных и наречий.")
-
-    # Дополнительные рекомендации на основе комбинации метрик
-    if results["flesch_reading_ease"] < 50 and results["gunning_fog_index"] > 15:
-        improvements.append("Текст слишком сложен. Рассмотрите возможность полного переписывания.")
-        improvements.append("Определите целевую аудиторию и адаптируйте текст под её уровень.")
-
-    if results["flesch_kincaid_grade_level"] > 15:
-        improvements.append("Текст требует высшего образования для понимания. Упростите.")
-        improvements.append("Добавьте краткое содержание или аннотацию в начале.")
-
-    # Положительные отзывы для хороших текстов
-    if results["flesch_reading_ease"] >= 70:
-        improvements.append("Текст хорошо сбалансирован по сложности.")
-    if results["flesch_kincaid_grade_level"] < 10:
-        improvements.append("Уровень сложности подходит для большинства читателей.")
-    if results["gunning_fog_index"] < 10:
-        improvements.append("Использование сложных слов оптимально.")
+    improvements = collect_improvements(results, min_readability_score)
 
     if improvements:
         print("\nРекомендации по улучшению:")
         print("-" * 50)
         for i, suggestion in enumerate(improvements, start=1):
-            print(f"{i}. {suggestion}")
+            print(f"{i}. {suggestion.message}")
 
         # Сохранение рекомендаций в JSON (если разрешено)
         if show_json:
-            save_recommendations(results, improvements)
+            save_recommendations(results, improvements, sink)
     else:
         print("\nВаш текст достаточно прост для восприятия!")
         print("Все метрики находятся в оптимальном диапазоне.")
 
 
-def save_recommendations(results: Dict[str, float], improvements: list) -> None:
+def build_recommendations_record(results: Dict[str, float], improvements: List[Recommendation]) -> Dict:
     """
-    Сохраняет рекомендации в JSON файл.
+    Формирует структурированную запись с рекомендациями по одному документу.
 
     :param results: результаты анализа
     :param improvements: список рекомендаций
+    :return: словарь с исходными метриками, рекомендациями и сводкой
     """
-    recommendations_data = {
+    return {
         "timestamp": datetime.now().isoformat(),
         "original_metrics": {
             "flesch_reading_ease": round(results['flesch_reading_ease'], 2),
             "flesch_kincaid_grade_level": round(results['flesch_kincaid_grade_level'], 2),
             "gunning_fog_index": round(results['gunning_fog_index'], 2)
         },
-        "improvements": improvements,
+        "improvements": [r.message for r in improvements],
         "summary": {
             "total_recommendations": len(improvements),
-            "by_category": {
-                "flesch_reading_ease": sum(1 for s in improvements if "предложени" in s or "конструкц" in s),
-                "flesch_kincaid": sum(1 for s in improvements if "аудитори" in s or "термин" in s),
-                "gunning_fog": sum(1 for s in improvements if "слог" in s or "слов" in s)
-            }
+            "by_category": count_by_category(improvements)
         }
     }
 
-    filename = f"improvements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+def save_recommendations(results: Dict[str, float], improvements: List[Recommendation],
+                         sink: Optional[ReportSink] = None) -> None:
+    """
+    Сохраняет рекомендации в JSON файл.
+
+    :param results: результаты анализа
+    :param improvements: список рекомендаций
+    :param sink: общий файл записей; если задан, рекомендации добавляются в него, а не в отдельный файл
+        (файл CSV открывается с fieldnames=RECOMMENDATION_FIELDNAMES)
+    """
+    recommendations_data = build_recommendations_record(results, improvements)
+
+    if sink is not None:
+        sink.write(recommendations_data)
+        return
+
+    filename = f"improvements_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json"
 
     with open(filename, 'w', encoding='utf-8') as f:
         json.dump(recommendations_data, f, ensure_ascii=False, indent=2)
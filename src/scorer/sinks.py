@@ -0,0 +1,163 @@
+import abc
+import csv
+import io
+import json
+import os
+from typing import Dict, List, Optional
+
+from .results import METRIC_NAMES
+from .rules import CATEGORIES
+
+# Столбцы CSV для отчетов build_report_record и записей об ошибках пакетного анализа
+REPORT_FIELDNAMES = (["source", "timestamp", "error"] + [f"metrics.{name}" for name in METRIC_NAMES]
+                     + [f"interpretation.{name}" for name in METRIC_NAMES])
+# Столбцы CSV для записей simplifier.build_recommendations_record
+RECOMMENDATION_FIELDNAMES = (["timestamp"] + [f"original_metrics.{name}" for name in METRIC_NAMES]
+                             + ["improvements", "summary.total_recommendations"]
+                             + [f"summary.by_category.{category}" for category in CATEGORIES])
+
+
+def flatten_record(record: Dict, prefix: str = "") -> Dict:
+    """
+    Разворачивает вложенные словари в плоский: {"metrics": {"x": 1}} -> {"metrics.x": 1}.
+
+    Списки склеиваются в строку через " | ".
+    """
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, f"{name}."))
+        elif isinstance(value, (list, tuple)):
+            flat[name] = " | ".join(str(v) for v in value)
+        else:
+            flat[name] = value
+    return flat
+
+
+class ReportSink(abc.ABC):
+    def __init__(self, path: str, flush_size: int = 1000, append: bool = False):
+        """
+        Конструктор класса ReportSink - буферизованного файла записей (одна запись на документ).
+
+        Записи накапливаются в памяти и пишутся в файл пачками по flush_size,
+        поэтому пакетный запуск создает один файл вместо тысяч.
+
+        :param path: путь к файлу
+        :param flush_size: сколько записей накапливать перед записью на диск
+        :param append: дописывать в существующий файл вместо перезаписи
+        """
+        self.path = path
+        self.flush_size = flush_size
+        self.append = append
+        self.records_written = 0
+        self._buffer: List[Dict] = []
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', newline='')
+
+    def write(self, record: Dict) -> None:
+        """
+        Добавляет запись.
+
+        :param record: словарь с данными по одному документу
+        """
+        self._buffer.append(record)
+        if len(self._buffer) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Записывает накопленные записи на диск."""
+        if not self._buffer:
+            return
+        self._file.write(self._serialize(self._buffer))
+        self._file.flush()
+        self.records_written += len(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Записывает остаток буфера и закрывает файл."""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    @abc.abstractmethod
+    def _serialize(self, records: List[Dict]) -> str:
+        """Текст пачки записей в формате файла."""
+
+    def __enter__(self) -> "ReportSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class JsonLinesSink(ReportSink):
+    """Записи в формате JSON Lines: по одному компактному JSON-объекту в строке."""
+
+    def _serialize(self, records: List[Dict]) -> str:
+        return "".join(json.dumps(r, ensure_ascii=False, separators=(',', ':')) + "\n" for r in records)
+
+
+class CsvSink(ReportSink):
+    def __init__(self, path: str, flush_size: int = 1000, fieldnames: Optional[List[str]] = None,
+                 append: bool = False):
+        """
+        Конструктор класса CsvSink - записей в виде строк CSV с развернутыми вложенными полями.
+
+        Столбцы задаются заранее, поэтому не зависят от того, какие записи попали
+        в первую пачку. Запись с полем, которого нет среди столбцов, отклоняется
+        с ValueError, а не теряется молча. Заголовок пишется, только если файл пуст.
+
+        :param path: путь к файлу
+        :param flush_size: сколько записей накапливать перед записью на диск
+        :param fieldnames: список столбцов (по умолчанию REPORT_FIELDNAMES,
+            для рекомендаций - RECOMMENDATION_FIELDNAMES)
+        :param append: дописывать в существующий файл вместо перезаписи
+        """
+        self.fieldnames = list(fieldnames or REPORT_FIELDNAMES)
+        self._known_fields = frozenset(self.fieldnames)
+        self._header_written = append and os.path.exists(path) and os.path.getsize(path) > 0
+        super().__init__(path, flush_size, append)
+
+    def write(self, record: Dict) -> None:
+        """
+        Добавляет запись, развернув вложенные поля.
+
+        :param record: словарь с данными по одному документу
+        :raises ValueError: в записи есть поля, которых нет среди столбцов
+        """
+        row = flatten_record(record)
+        unknown = row.keys() - self._known_fields
+        if unknown:
+            raise ValueError(f"Поля {', '.join(sorted(unknown))} нет среди столбцов CSV {self.path}")
+        super().write(row)
+
+    def _serialize(self, records: List[Dict]) -> str:
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=self.fieldnames, restval='')
+        if not self._header_written:
+            writer.writeheader()
+            self._header_written = True
+        writer.writerows(records)
+        return output.getvalue()
+
+
+def open_sink(path: str, output_format: Optional[str] = None, flush_size: int = 1000,
+              append: bool = False, fieldnames: Optional[List[str]] = None) -> ReportSink:
+    """
+    Открывает файл записей нужного формата.
+
+    :param path: путь к файлу
+    :param output_format: "jsonl" или "csv" (по умолчанию определяется по расширению)
+    :param flush_size: сколько записей накапливать перед записью на диск
+    :param append: дописывать в существующий файл (по умолчанию файл перезаписывается)
+    :param fieldnames: столбцы CSV (по умолчанию REPORT_FIELDNAMES, для рекомендаций - RECOMMENDATION_FIELDNAMES)
+    :return: объект ReportSink
+    """
+    if output_format is None:
+        output_format = "csv" if path.lower().endswith(".csv") else "jsonl"
+    if output_format == "csv":
+        return CsvSink(path, flush_size, fieldnames, append)
+    if output_format == "jsonl":
+        return JsonLinesSink(path, flush_size, append)
+    raise ValueError(f"Неизвестный формат вывода: {output_format}")
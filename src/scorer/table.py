@@ -0,0 +1,190 @@
+import argparse
+import csv
+import math
+import os
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .languages import LANGUAGES
+from .metrics import calculate_scores, count_text
+from .results import COUNT_NAMES, METRIC_NAMES, ResultColumns
+
+DEFAULT_ROWS_PER_TASK = 10_000
+DEFAULT_BLOCK_ROWS = 100_000
+
+CountColumns = Tuple[array, array, array, array]
+
+
+def _count_rows(texts: List, language: Optional[str] = None) -> CountColumns:
+    """Счетчики строк пачки в рабочем процессе; пустые и нестроковые значения дают нули."""
+    columns: CountColumns = (array('q'), array('q'), array('q'), array('q'))
+    for text in texts:
+        counts = count_text(text, language) if isinstance(text, str) and text else (0, 0, 0, 0)
+        for column, value in zip(columns, counts):
+            column.append(value)
+    return columns
+
+
+def _submit_bounded(chunks: Iterator[List], count: Callable[[List], CountColumns], executor: Executor,
+                    max_inflight: int) -> Iterator[CountColumns]:
+    """Отдает пачки в пул, держа в работе не больше max_inflight пачек; результаты в порядке пачек."""
+    pending: Deque[Future] = deque(executor.submit(count, chunk) for chunk in islice(chunks, max_inflight))
+    while pending:
+        future = pending.popleft()
+        chunk = next(chunks, None)
+        if chunk is not None:
+            pending.append(executor.submit(count, chunk))
+        yield future.result()
+
+
+def count_rows(texts: Iterable[Optional[str]], language: Optional[str] = None, workers: Optional[int] = None,
+               rows_per_task: int = DEFAULT_ROWS_PER_TASK, executor: Optional[Executor] = None) -> Dict[str, array]:
+    """
+    Считает слова, предложения, слоги и сложные слова для каждой строки столбца.
+
+    Строки передаются процессам пачками по rows_per_task, поэтому накладные
+    расходы на задачу делятся на всю пачку, а в работе одновременно не больше
+    двух пачек на процесс. Если строк не больше одной пачки, пул не создается.
+
+    :param texts: строки столбца (None и пустые строки допустимы)
+    :param language: код языка для всех строк (по умолчанию определяется для каждой строки)
+    :param workers: число процессов (по умолчанию - число ядер, 1 - без пула)
+    :param rows_per_task: сколько строк передавать процессу за раз
+    :param executor: готовый пул процессов, например общий для нескольких вызовов
+    :return: счетчик -> массив значений по строкам
+    """
+    count = partial(_count_rows, language=language)
+    rows = iter(texts)
+    chunks = iter(lambda: list(islice(rows, rows_per_task)), [])
+    first = next(chunks, None)
+    second = next(chunks, None)
+    all_chunks = chain((chunk for chunk in (first, second) if chunk is not None), chunks)
+    max_inflight = 2 * (workers or os.cpu_count() or 1)
+
+    totals = {name: array('q') for name in COUNT_NAMES}
+    if executor is not None:
+        parts = _submit_bounded(all_chunks, count, executor, max_inflight)
+        _extend_counts(totals, parts)
+    elif second is None or workers == 1:
+        _extend_counts(totals, map(count, all_chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            _extend_counts(totals, _submit_bounded(all_chunks, count, pool, max_inflight))
+    return totals
+
+
+def _extend_counts(totals: Dict[str, array], parts: Iterable[CountColumns]) -> None:
+    for part in parts:
+        for name, column in zip(COUNT_NAMES, part):
+            totals[name].extend(column)
+
+
+def _score_counts(counts: Dict[str, array]) -> Dict[str, array]:
+    """
+    Индексы по столбцам счетчиков: векторно при наличии NumPy, иначе построчно.
+
+    Как и в hotspots, строка со словами, но без знаков конца предложения,
+    считается одним предложением: столбец sentences исправляется на месте,
+    чтобы счетчики строки соответствовали ее индексам. NaN получают только
+    строки без слов.
+    """
+    try:
+        import numpy as np
+        from .vectorized import score_batch
+    except ImportError:
+        scores = {name: array('d') for name in METRIC_NAMES}
+        sentences_column = counts['sentences']
+        for index, (words, sentences, syllables, complex_words) in enumerate(
+                zip(*(counts[name] for name in COUNT_NAMES))):
+            if words:
+                if not sentences:
+                    sentences = sentences_column[index] = 1
+                results = calculate_scores(words, sentences, syllables, complex_words)
+                for name in METRIC_NAMES:
+                    scores[name].append(results[name])
+            else:
+                for name in METRIC_NAMES:
+                    scores[name].append(math.nan)
+        return scores
+    words, sentences, syllables, complex_words = (np.frombuffer(counts[name], dtype=np.int64) for name in COUNT_NAMES)
+    sentences = np.where(words > 0, np.maximum(sentences, 1), sentences)
+    counts['sentences'] = array('q', sentences.astype(np.int64).tobytes())
+    vectors = score_batch(words, sentences, syllables, complex_words)
+    return {name: array('d', vectors[name].tobytes()) for name in METRIC_NAMES}
+
+
+def score_rows(texts: Iterable[Optional[str]], language: Optional[str] = None, workers: Optional[int] = None,
+               rows_per_task: int = DEFAULT_ROWS_PER_TASK, executor: Optional[Executor] = None) -> ResultColumns:
+    """
+    Оценивает читаемость каждой строки столбца текстов без файлов и DocumentReader.
+
+    Результат выровнен по входным строкам: строка без знаков конца предложения
+    считается одним предложением (и в индексах, и в счетчике sentences), а строки без слов (в том числе None и пустые)
+    получают NaN вместо ZeroDivisionError.
+    Столбцы можно передать в pandas или NumPy без копирования, например
+    numpy.frombuffer(result.column('flesch_reading_ease')).
+
+    :param texts: строки столбца
+    :param language: код языка для всех строк (по умолчанию определяется для каждой строки)
+    :param workers: число процессов (по умолчанию - число ядер, 1 - без пула)
+    :param rows_per_task: сколько строк передавать процессу за раз
+    :param executor: готовый пул процессов, например общий для нескольких вызовов
+    :return: счетчики и метрики по строкам
+    """
+    counts = count_rows(texts, language, workers, rows_per_task, executor)
+    scores = _score_counts(counts)
+    return ResultColumns.from_columns({**counts, **scores})
+
+
+def _iter_blocks(rows: Iterator[Dict[str, str]], block_rows: int) -> Iterator[List[Dict[str, str]]]:
+    return iter(lambda: list(islice(rows, block_rows)), [])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Оценка читаемости текстового столбца таблицы CSV.")
+    parser.add_argument("input", help="входной файл CSV с заголовком")
+    parser.add_argument("--column", required=True, help="имя столбца с текстом")
+    parser.add_argument("--output", default=None, help="выходной CSV (по умолчанию stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="число процессов")
+    parser.add_argument("--rows-per-task", type=int, default=DEFAULT_ROWS_PER_TASK, help="строк на одну задачу процесса")
+    parser.add_argument("--block-rows", type=int, default=DEFAULT_BLOCK_ROWS,
+                        help="сколько строк таблицы держать в памяти одновременно")
+    parser.add_argument("--language", choices=sorted(LANGUAGES), default=None,
+                        help="язык текстов (по умолчанию определяется для каждой строки)")
+    args = parser.parse_args(argv)
+
+    csv.field_size_limit(sys.maxsize)
+    with open(args.input, 'r', encoding='utf-8', newline='') as source:
+        reader = csv.DictReader(source)
+        if reader.fieldnames is None or args.column not in reader.fieldnames:
+            print(f"В таблице нет столбца {args.column}", file=sys.stderr)
+            return 1
+        output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+        # Пул создается один раз и используется для всех блоков таблицы
+        executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers != 1 else None
+        try:
+            writer = csv.DictWriter(output, fieldnames=list(reader.fieldnames) + list(METRIC_NAMES))
+            writer.writeheader()
+            for block in _iter_blocks(reader, args.block_rows):
+                scored = score_rows((row[args.column] for row in block), args.language, args.workers,
+                                    args.rows_per_task, executor)
+                columns = scored.metric_columns()
+                for index, row in enumerate(block):
+                    row.update((name, '' if math.isnan(values[index]) else values[index])
+                               for name, values in columns.items())
+                    writer.writerow(row)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if output is not sys.stdout:
+                output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())